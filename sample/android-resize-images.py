@@ -32,7 +32,9 @@ if __name__ == "__main__":
 
             width, height = img.size
 
-            for dpi, ratio in MANIFEST:
-                cimg = img.clone()
-                cimg.resize(int(width * ratio), int(height * ratio))
-                cimg.save(filename="res/drawable-%sdpi/%s" % (dpi, filename))
+            img.renditions([
+                {'width': int(width * ratio),
+                 'height': int(height * ratio),
+                 'filename': "res/drawable-%sdpi/%s" % (dpi, filename)}
+                for dpi, ratio in MANIFEST
+            ])
@@ -6,6 +6,8 @@
 # discovers tests just using filenames.  Fortuneately, it seems to run
 # tests in lexicographical order, so we simply adds underscore to
 # the beginning of the filename.
+import threading
+
 from pytest import mark, raises
 
 from wand import exceptions, resource
@@ -51,6 +53,73 @@ def test_negative_refcount():
         resource.decrement_refcount()
 
 
+def test_refcount_threads(monkeypatch):
+    """Refcount survives many threads at once."""
+    called = {'genesis': 0, 'terminus': 0}
+
+    def counting_genesis():
+        called['genesis'] += 1
+
+    def counting_terminus():
+        called['terminus'] += 1
+
+    monkeypatch.setattr(resource, 'genesis', counting_genesis)
+    monkeypatch.setattr(resource, 'terminus', counting_terminus)
+
+    def churn():
+        for _ in range(1000):
+            resource.increment_refcount()
+            resource.decrement_refcount()
+
+    resource.increment_refcount()
+    threads = [threading.Thread(target=churn) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert resource.reference_count == 1
+    assert called == {'genesis': 1, 'terminus': 0}
+    resource.decrement_refcount()
+    assert resource.reference_count == 0
+    assert called == {'genesis': 1, 'terminus': 1}
+
+
+def test_keep_alive(monkeypatch):
+    called = {'genesis': 0, 'terminus': 0}
+    monkeypatch.setattr(resource, 'genesis',
+                        lambda: called.update(genesis=called['genesis'] + 1))
+    monkeypatch.setattr(resource, 'terminus',
+                        lambda: called.update(terminus=called['terminus'] + 1))
+    resource.keep_alive()
+    resource.keep_alive()
+    assert resource.reference_count == 1
+    for _ in range(3):
+        resource.increment_refcount()
+        resource.decrement_refcount()
+    assert called == {'genesis': 1, 'terminus': 0}
+    resource.keep_alive(False)
+    resource.keep_alive(False)
+    assert resource.reference_count == 0
+    assert called == {'genesis': 1, 'terminus': 1}
+
+
+def test_session(monkeypatch):
+    called = {'genesis': 0, 'terminus': 0}
+    monkeypatch.setattr(resource, 'genesis',
+                        lambda: called.update(genesis=called['genesis'] + 1))
+    monkeypatch.setattr(resource, 'terminus',
+                        lambda: called.update(terminus=called['terminus'] + 1))
+    with resource.session():
+        with resource.session():
+            assert resource.reference_count == 2
+        for _ in range(3):
+            resource.increment_refcount()
+            resource.decrement_refcount()
+        assert called == {'genesis': 1, 'terminus': 0}
+    assert resource.reference_count == 0
+    assert called == {'genesis': 1, 'terminus': 1}
+
+
 class DummyResource(resource.Resource):
 
     def set_exception_type(self, idx):
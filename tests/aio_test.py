@@ -0,0 +1,149 @@
+import threading
+
+from pytest import fixture, importorskip, raises
+
+from wand.color import Color
+from wand.image import ClosedImageError, Image
+
+asyncio = importorskip('asyncio')
+aio = importorskip('wand.aio')
+
+
+@fixture
+def fx_loop(request):
+    loop = asyncio.new_event_loop()
+    request.addfinalizer(loop.close)
+    return loop
+
+
+def test_open_transform_make_blob(fx_loop, fx_asset):
+    executor = aio.Executor(workers=2, max_pending=1, loop=fx_loop)
+    try:
+        img = fx_loop.run_until_complete(aio.open(
+            filename=str(fx_asset.join('mona-lisa.jpg')),
+            executor=executor
+        ))
+        assert executor.loads == [1, 0]
+        fx_loop.run_until_complete(img.transform(resize='32x32>'))
+        blobs = fx_loop.run_until_complete(asyncio.gather(
+            *[img.make_blob('png') for _ in range(4)]
+        ))
+        assert executor.pending == 0
+        fx_loop.run_until_complete(img.close())
+        assert executor.loads == [0, 0]
+    finally:
+        executor.shutdown()
+    assert len(set(blobs)) == 1
+    with Image(blob=blobs[0]) as result:
+        assert result.format == 'PNG'
+        assert max(result.size) == 32
+
+
+def test_open_error(fx_loop):
+    executor = aio.Executor(workers=1, loop=fx_loop)
+    try:
+        future = aio.open(filename='/no/such/file.png', executor=executor)
+        fx_loop.run_until_complete(asyncio.wait([future]))
+        assert future.exception() is not None
+        assert executor.loads == [0]
+    finally:
+        executor.shutdown()
+
+
+def test_pinned_thread(fx_loop):
+    executor = aio.Executor(workers=3, loop=fx_loop)
+    try:
+        img = fx_loop.run_until_complete(aio.open(
+            width=4, height=4, background=Color('red'), executor=executor
+        ))
+        names = fx_loop.run_until_complete(asyncio.gather(*[
+            img.run(lambda image: threading.current_thread().name)
+            for _ in range(6)
+        ]))
+        assert len(set(names)) == 1
+        fx_loop.run_until_complete(img.close())
+    finally:
+        executor.shutdown()
+
+
+def test_open_cancelled(fx_loop, monkeypatch):
+    opened = []
+
+    class RecordedImage(Image):
+        def __init__(self, *args, **kwargs):
+            super(RecordedImage, self).__init__(*args, **kwargs)
+            opened.append(self)
+
+    monkeypatch.setattr('wand.aio.Image', RecordedImage)
+    executor = aio.Executor(workers=1, loop=fx_loop)
+    try:
+        gate = threading.Event()
+        blocked = executor.submit(0, gate.wait)
+        future = aio.open(width=4, height=4, executor=executor)
+        future.cancel()
+        # The image is opened on the worker after all, and then closed.
+        gate.set()
+        fx_loop.run_until_complete(blocked)
+        for _ in range(100):
+            if executor.loads == [0] and executor.pending == 0:
+                break
+            fx_loop.run_until_complete(asyncio.sleep(0.01))
+        assert executor.loads == [0]
+        assert len(opened) == 1
+        with raises(ClosedImageError):
+            opened[0].wand
+    finally:
+        executor.shutdown()
+
+
+def test_backpressure(fx_loop):
+    executor = aio.Executor(workers=1, max_pending=1, max_waiting=1,
+                            loop=fx_loop)
+    try:
+        gate = threading.Event()
+        blocked = executor.submit(0, gate.wait)
+        first = aio.open(width=4, height=4, executor=executor)
+        assert executor.saturated
+        # The producer is held back until there's room, and the operations
+        # beyond it aren't queued for the workers meanwhile.
+        ready = executor.ready()
+        second = aio.open(width=4, height=4, executor=executor)
+        fx_loop.run_until_complete(asyncio.sleep(0.05))
+        assert not ready.done()
+        assert len(executor.waiting) == 1
+        gate.set()
+        fx_loop.run_until_complete(asyncio.gather(blocked, ready))
+        # The reservation is taken by the next operation.
+        third = aio.open(width=4, height=4, executor=executor)
+        images = fx_loop.run_until_complete(asyncio.gather(first, second,
+                                                           third))
+        fx_loop.run_until_complete(asyncio.gather(
+            *[image.close() for image in images]
+        ))
+        assert executor.reserved == 0
+        assert executor.loads == [0]
+    finally:
+        executor.shutdown()
+
+
+def test_close_cancelled(fx_loop):
+    executor = aio.Executor(workers=1, loop=fx_loop)
+    try:
+        img = fx_loop.run_until_complete(aio.open(width=4, height=4,
+                                                  executor=executor))
+        image = img.image
+        gate = threading.Event()
+        blocked = executor.submit(0, gate.wait)
+        closing = img.close()
+        closing.cancel()
+        gate.set()
+        fx_loop.run_until_complete(blocked)
+        for _ in range(100):
+            if executor.loads == [0]:
+                break
+            fx_loop.run_until_complete(asyncio.sleep(0.01))
+        assert executor.loads == [0]
+        with raises(ClosedImageError):
+            image.wand
+    finally:
+        executor.shutdown()
@@ -0,0 +1,59 @@
+import multiprocessing
+
+from pytest import mark, raises
+
+from wand.batch import process
+from wand.image import Image
+
+
+def test_process(fx_asset):
+    filenames = [str(fx_asset.join(name))
+                 for name in ('mona-lisa.jpg', 'pixels.png', 'beach.jpg')]
+    operations = ['auto_orient', ('transform', {'resize': '32x32>'}), 'strip']
+    results = list(process(filenames, operations, format='png',
+                           workers=2, max_pending=1))
+    assert [filename for filename, _ in results] == filenames
+    for _, blob in results:
+        with Image(blob=blob) as img:
+            assert img.format == 'PNG'
+            assert max(img.size) <= 32
+
+
+def test_process_output(tmpdir, fx_asset):
+    filenames = [str(fx_asset.join('mona-lisa.jpg'))]
+    output = str(tmpdir.join('{index}-{stem}.jpg'))
+    results = list(process(filenames, [('resize', {'width': 20,
+                                                   'height': 30})],
+                           quality=50, output=output, workers=1))
+    expected = str(tmpdir.join('0-mona-lisa.jpg'))
+    assert results == [(filenames[0], expected)]
+    with Image(filename=expected) as img:
+        assert img.size == (20, 30)
+
+
+@mark.skipif(not hasattr(multiprocessing, 'get_context'),
+             reason='Python 2 can only fork')
+def test_process_start_method(fx_asset):
+    filenames = [str(fx_asset.join('pixels.png'))]
+    results = list(process(filenames, ['strip'], workers=1,
+                           start_method='spawn'))
+    assert [filename for filename, _ in results] == filenames
+    with raises(ValueError):
+        process([], [], start_method='no_such_method')
+
+
+def test_process_errors():
+    with raises(ValueError):
+        process([], ['no_such_method'])
+    with raises(ValueError):
+        process([], ['_repr_png_'])
+    with raises(TypeError):
+        process([], [('resize', 100, 100)])
+    with raises(ValueError):
+        process([], [], workers=0)
+    with raises(ValueError):
+        process([], [], max_pending=0)
+    with raises(TypeError):
+        process([], [], quality='high')
+    with raises(TypeError):
+        process([], [], start_method=1)
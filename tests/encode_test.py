@@ -0,0 +1,38 @@
+from pytest import raises
+
+from wand.encode import encode_many
+from wand.image import Image
+
+
+def test_encode_many(fx_asset):
+    with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as img:
+        was = img.signature
+        png, good, bad = encode_many(img, [
+            'png',
+            ('jpeg', {'quality': 90}),
+            ('jpeg', {'quality': 10, 'jpeg:sampling-factor': '4:2:0'})
+        ], workers=3)
+        assert img.format == 'JPEG'
+        assert img.signature == was
+    assert len(bad) < len(good)
+    with Image(blob=png) as img:
+        assert img.format == 'PNG'
+        assert img.size == (402, 599)
+    with Image(blob=good) as img:
+        assert img.format == 'JPEG'
+        assert img.size == (402, 599)
+
+
+def test_encode_many_errors(fx_asset):
+    with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as img:
+        assert encode_many(img, []) == []
+        with raises(TypeError):
+            encode_many(img, [123])
+        with raises(TypeError):
+            encode_many(img, [('jpeg', {'quality': '90'})])
+        with raises(ValueError):
+            encode_many(img, ['png'], workers=0)
+        with raises(ValueError):
+            encode_many(img, ['png', 'unsupported-format'])
+    with raises(TypeError):
+        encode_many('mona-lisa.jpg', ['png'])
@@ -2,16 +2,20 @@
 #
 # These test cover the Image methods that directly map to C-API function calls.
 #
+import array
 import io
+import threading
+import time
 import warnings
 
 from pytest import mark, raises
 
 from wand.color import Color
-from wand.exceptions import MissingDelegateError, OptionError
+from wand.exceptions import (MissingDelegateError, OptionError,
+                             WandAbortedError)
 from wand.image import Image
 from wand.font import Font
-from wand.version import MAGICK_VERSION_NUMBER
+from wand.version import MAGICK_VERSION_NUMBER, QUANTUM_RANGE
 
 
 def test_auto_orientation(fx_asset):
@@ -95,6 +99,26 @@ def test_caption_without_font(fx_asset):
             )
 
 
+def test_channel_statistics(fx_asset):
+    with Image(filename=str(fx_asset.join('pixels.png'))) as img:
+        stats = img.channel_statistics()
+        # ImageMagick-6 has inverted alpha, i.e. opacity, instead.
+        alpha = 'alpha' if MAGICK_VERSION_NUMBER >= 0x700 else 'opacity'
+        assert set(stats) == set(['red', 'green', 'blue', alpha])
+        red = stats['red']
+        assert red.minima == 0
+        assert red.maxima == QUANTUM_RANGE
+        assert abs(red.mean - QUANTUM_RANGE / 4.0) < 1
+        first = img.channel_statistics(region=(0, 0, 1, 1))
+        assert first['red'].mean == QUANTUM_RANGE
+        assert first['green'].mean == 0
+        with raises(ValueError):
+            img.channel_statistics(region=(0, 0, 5, 1))
+    with Image(filename='rose:') as img:
+        img.transform_colorspace('gray')
+        assert list(img.channel_statistics()) == ['gray']
+
+
 def test_clut(fx_asset):
     with Image(filename='rose:') as img:
         was = img.signature
@@ -314,6 +338,27 @@ def test_crop_issue367(fx_asset):
                 assert actual.size == expected
 
 
+def test_crop_many(fx_asset):
+    with Image(filename=str(fx_asset.join('pixels.png'))) as img:
+        was = img.signature
+        left, right = img.crop_many([(0, 0, 2, 1), (2, 0, 2, 1)])
+        try:
+            assert left.size == right.size == (2, 1)
+            assert left.page == right.page == (2, 1, 0, 0)
+            assert left[0, 0] == Color('red')
+            assert right[0, 0] == Color('blue')
+            assert right[1, 0].alpha == 0
+        finally:
+            left.close()
+            right.close()
+        assert img.signature == was
+        assert img.crop_many([]) == []
+        with raises(ValueError):
+            img.crop_many([(0, 0, 2, 1), (3, 0, 2, 1)])
+        with raises(TypeError):
+            img.crop_many([(0, 0, 2)])
+
+
 def test_deskew(fx_asset):
     with Image(filename='rose:') as img:
         was = img.signature
@@ -406,6 +451,33 @@ def test_evaluate_user_error(fx_asset):
             img.evaluate(operator='set', value=1.0, channel='Not a channel')
 
 
+def test_export_array(fx_asset):
+    with Image(filename=str(fx_asset.join('pixels.png'))) as img:
+        img.depth = 8
+        data = img.export_array(channel_map='RGBA', storage='char')
+        assert len(data) == 1
+        assert len(data[0]) == 4
+        assert list(data[0][0]) == [0xFF, 0x00, 0x00, 0xFF]
+        assert list(data[0][3]) == [0x00, 0x00, 0x00, 0x00]
+        # Reuse a preallocated buffer, and guess storage from its type.
+        out = array.array('H', [0] * 4 * 3)
+        assert img.export_array(channel_map='RGB', out=out) is out
+        assert list(out[:3]) == [0xFFFF, 0x0000, 0x0000]
+        out = bytearray(4 * 3)
+        img.export_array(channel_map='RGB', storage='char', out=out)
+        assert list(out[3:6]) == [0x00, 0xFF, 0x00]
+        with raises(ValueError):
+            img.export_array(channel_map='RGBA', out=bytearray(4 * 3))
+        with raises(TypeError):
+            img.export_array(out=b'read-only bytes')
+        with raises(TypeError):
+            img.export_array(channel_map=0xDEADBEEF)
+        with raises(ValueError):
+            img.export_array(channel_map='NaN')
+        with raises(ValueError):
+            img.export_array(storage='NaN')
+
+
 def test_export_pixels(fx_asset):
     with Image(filename=str(fx_asset.join('pixels.png'))) as img:
         img.depth = 8  # Not need, but want to match import.
@@ -433,6 +505,28 @@ def test_export_pixels(fx_asset):
             img.export_pixels(storage='NaN')
 
 
+def test_export_pixels_out(fx_asset):
+    with Image(filename=str(fx_asset.join('pixels.png'))) as img:
+        img.depth = 8
+        out = bytearray(2 * 4)
+        r = img.export_pixels(x=1, y=0, width=2, height=1,
+                              channel_map='RGBA', storage='char', out=out)
+        assert r is out
+        assert list(out) == [0x00, 0xFF, 0x00, 0xFF,
+                             0x00, 0x00, 0xFF, 0xFF]
+        # Reuse the same buffer, and size the region from the offset.
+        img.export_pixels(x=2, channel_map='RGBA', out=out)
+        assert list(out) == [0x00, 0x00, 0xFF, 0xFF,
+                             0x00, 0x00, 0x00, 0x00]
+        assert len(img.export_pixels(x=3, channel_map='RGB')) == 3
+        with raises(ValueError):
+            img.export_pixels(channel_map='RGBA', out=out)
+        with raises(TypeError):
+            img.export_pixels(channel_map='RGBA', out=bytes(out))
+        with raises(TypeError):
+            img.export_pixels(channel_map='RGBA', out=array.array('b', out))
+
+
 def test_extent(fx_asset):
     with Image(filename=str(fx_asset.join('croptest.png'))) as img:
         with img.clone() as extended:
@@ -454,6 +548,30 @@ def test_extent(fx_asset):
             img.extent(height=-10)
 
 
+def test_fingerprint(fx_asset):
+    with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as img:
+        crc = img.fingerprint()
+        assert len(crc) in (32, 40)  # blake2b or sha1
+        assert img.fingerprint() == crc
+        assert len(img.fingerprint('crc32')) == 8
+        assert img.fingerprint('adler32') != img.fingerprint('crc32')
+        assert len(img.fingerprint('md5')) == 32
+        with img.clone() as deeper:
+            deeper.depth = 16
+            assert deeper.fingerprint() == crc
+        with img[10:20, 10:30] as cropped:
+            region = img.fingerprint(region=(10, 10, 10, 20))
+            assert cropped.fingerprint() == region
+        img.negate()
+        assert img.fingerprint() != crc
+        with raises(ValueError):
+            img.fingerprint('no-such-hash')
+        with raises(ValueError):
+            img.fingerprint(region=(0, 0, img.width + 1, 1))
+        with raises(TypeError):
+            img.fingerprint(region=(0, 0))
+
+
 def test_flip(fx_asset):
     with Image(filename=str(fx_asset.join('beach.jpg'))) as img:
         with img.clone() as flipped:
@@ -594,6 +712,19 @@ def test_gaussian_blur(fx_asset, display):
         assert 0.655 <= after.blue < 0.67
 
 
+def test_get_pixels(fx_asset):
+    with Image(filename=str(fx_asset.join('pixels.png'))) as img:
+        red, blue, transparent = img.get_pixels([(0, 0), (2, 0), (-1, -1)])
+        assert red == Color('red')
+        assert blue == Color('blue')
+        assert transparent.alpha == 0
+        assert img.get_pixels([]) == []
+        with raises(IndexError):
+            img.get_pixels([(4, 0)])
+        with raises(TypeError):
+            img.get_pixels([(0.5, 0)])
+
+
 def test_hald_clut(fx_asset):
     with Image(filename='rose:') as img:
         was = img.signature
@@ -643,6 +774,40 @@ def test_import_pixels(fx_asset):
             dst.import_pixels(data=[0x00, 0xFF])
 
 
+def test_import_pixels_buffer(fx_asset):
+    data = [0xFF, 0x00, 0x00, 0xFF,
+            0x00, 0xFF, 0x00, 0xFF,
+            0x00, 0x00, 0xFF, 0xFF,
+            0x00, 0x00, 0x00, 0x00]
+    with Image(filename=str(fx_asset.join('pixels.png'))) as expected:
+        expected.depth = 8
+        for buffer in (bytes(bytearray(data)), bytearray(data),
+                       memoryview(bytearray(data)), array.array('B', data)):
+            with Image(width=4, height=1, background=Color('BLACK')) as dst:
+                dst.depth = 8
+                dst.import_pixels(channel_map='RGBA', data=buffer)
+                assert dst.signature == expected.signature
+        # Storage is guessed from the item type.
+        with Image(width=4, height=1, background=Color('BLACK')) as dst:
+            dst.depth = 8
+            shorts = array.array('H', [v * 0x101 for v in data])
+            dst.import_pixels(channel_map='RGBA', data=shorts)
+            assert dst.signature == expected.signature
+        with Image(width=4, height=1, background=Color('BLACK')) as dst:
+            with raises(ValueError):
+                dst.import_pixels(channel_map='RGBA', data=b'\xFF' * 15)
+            with raises(ValueError):
+                dst.import_pixels(channel_map='RGBA', storage='short',
+                                  data=bytearray(data))
+            # Signed item types aren't taken as unsigned.
+            with raises(TypeError):
+                dst.import_pixels(channel_map='RGBA',
+                                  data=array.array('b', [0] * 16))
+            # Region defaults to the rest of the image.
+            dst.import_pixels(x=2, channel_map='RGBA', data=bytearray(8))
+            assert dst[3, 0].alpha == 0
+
+
 def test_level(fx_asset):
     with Image(filename=str(fx_asset.join('gray_range.jpg'))) as img:
         # Adjust the levels to make this image entirely black
@@ -852,6 +1017,58 @@ def test_modulate(fx_asset, display):
         assert 0.80 <= after.blue <= 0.97
 
 
+def test_monitor(fx_asset):
+    with Image(filename='rose:') as img:
+        tags = []
+
+        def callback(tag, offset, span):
+            tags.append(tag)
+            return True
+
+        with img.monitor(callback):
+            img.resize(140, 92)
+        assert img.size == (140, 92)
+        assert any(tag.startswith('Resize') for tag in tags)
+        with raises(WandAbortedError):
+            with img.monitor(lambda tag, offset, span: False):
+                img.resize(70, 46)
+        with raises(WandAbortedError):
+            img.resize(10, 10, deadline=time.time() - 1)
+        cancelled = threading.Event()
+        cancelled.set()
+        with raises(WandAbortedError):
+            img.distort('scale_rotate_translate', (45,),
+                        cancel_event=cancelled)
+        # Monitors are gone after the blocks.
+        img.resize(35, 23)
+        assert img.size == (35, 23)
+        with raises(TypeError):
+            with img.monitor(callback=123):
+                pass
+
+
+def test_monitor_nested(fx_asset):
+    with Image(filename='rose:') as img:
+        cancelled = threading.Event()
+        with raises(WandAbortedError):
+            with img.monitor(deadline=time.time() - 1):
+                # The outer deadline is in effect within the inner block,
+                # and after it ends.
+                with raises(WandAbortedError):
+                    img.resize(140, 92, cancel_event=cancelled)
+                img.resize(70, 46)
+        tags = []
+        with img.monitor(lambda tag, offset, span: tags.append(tag)):
+            img.resize(140, 92, cancel_event=cancelled)
+            assert tags
+            del tags[:]
+            img.resize(70, 46)
+            assert tags
+        del tags[:]
+        img.resize(35, 23)
+        assert not tags
+
+
 def test_morphology_builtin(fx_asset):
     known = []
     args = (('erode', 'ring'),
@@ -1010,6 +1227,57 @@ def test_quantize(fx_asset):
         assert len(colors) <= number_colors
 
 
+def test_regions(fx_asset):
+    with Image(filename=str(fx_asset.join('pixels.png'))) as img:
+        red, blue = img.regions([(0, 0, 1, 1), (2, 0, 2, 1)], 'RGBA')
+        assert len(red) == 1 and len(red[0]) == 1
+        assert list(red[0][0]) == [255, 0, 0, 255]
+        assert len(blue[0]) == 2
+        assert list(blue[0][0]) == [0, 0, 255, 255]
+        assert blue[0][1][3] == 0
+        gray, = img.regions([(0, 0, 4, 1)], 'I', 'double')
+        assert len(gray[0]) == 4
+        assert img.regions([]) == []
+        with raises(ValueError):
+            img.regions([(0, 0, 5, 1)])
+
+
+def test_renditions(tmpdir, fx_asset):
+    filename = str(tmpdir.join('small.png'))
+    with Image(filename='rose:') as img:
+        was = img.signature
+        blobs = img.renditions([
+            {'width': 35},
+            {'width': 8, 'height': 8, 'format': 'png'},
+            {'height': 23, 'format': 'jpeg', 'quality': 50},
+            {'width': 14, 'filename': filename}
+        ], workers=2)
+        assert img.signature == was
+        assert img.size == (70, 46)
+    assert len(blobs) == 4
+    assert blobs[3] is None
+    with Image(blob=blobs[0]) as half:
+        assert half.size == (35, 23)
+    with Image(blob=blobs[1]) as square:
+        assert square.size == (8, 8)
+        assert square.format == 'PNG'
+    with Image(blob=blobs[2]) as jpeg:
+        assert jpeg.size == (35, 23)
+        assert jpeg.format == 'JPEG'
+    with Image(filename=filename) as small:
+        assert small.size == (14, 9)
+    with Image(filename='rose:') as img:
+        assert img.renditions([]) == []
+        with raises(ValueError):
+            img.renditions([{'format': 'png'}])
+        with raises(ValueError):
+            img.renditions([{'width': 10, 'size': 10}])
+        with raises(TypeError):
+            img.renditions([(10, 10)])
+        with raises(TypeError):
+            img.renditions([{'width': 10.5}])
+
+
 @mark.parametrize(('density', 'expected_size'), [
     ((72, 72), (800, 600)),
     ((36, 36), (400, 300)),
@@ -1221,6 +1489,36 @@ def test_rotate_reset_coords(fx_asset):
         assert img[85, 85] == Color('transparent')
 
 
+def test_set_pixels(fx_asset):
+    with Image(width=4, height=2, background=Color('white')) as img:
+        img.set_pixels([(0, 0), (1, 0), (-1, -1)], 'red')
+        assert img[0, 0] == Color('red')
+        assert img[1, 0] == Color('red')
+        assert img[3, 1] == Color('red')
+        assert img[2, 0] == Color('white')
+        img.set_pixels([(3, 0), (2, 0), (0, 1)],
+                       [Color('blue'), 'lime', Color('black')])
+        assert img.get_pixels([(2, 0), (3, 0), (0, 1)]) == [
+            Color('lime'), Color('blue'), Color('black')
+        ]
+        img.set_pixels([(1, 1), (2, 1)], b'\xff\x00\xff\x00\xff\xff',
+                       channel_map='RGB')
+        assert img[1, 1] == Color('magenta')
+        assert img[2, 1] == Color('cyan')
+        data = array.array('d', [1.0, 1.0, 0.0, 0.0, 0.0, 0.0])
+        img.set_pixels([(0, 0), (0, 0)], data, channel_map='RGB')
+        assert img[0, 0] == Color('black')
+        with raises(IndexError):
+            img.set_pixels([(4, 0)], 'red')
+        with raises(ValueError):
+            img.set_pixels([(0, 0), (1, 0)], ['red'])
+        with raises(ValueError):
+            img.set_pixels([(0, 0)], b'\x00', channel_map='RGB')
+        with raises(TypeError):
+            img.set_pixels([(0, 0)], array.array('b', [0, 0, 0]),
+                           channel_map='RGB')
+
+
 def test_shade(fx_asset):
     with Image(filename='rose:') as img:
         was = img.signature
@@ -1310,6 +1608,23 @@ def test_threshold_channel(fx_asset):
                     red.green_int8 == red.blue_int8 == 0)
 
 
+def test_thumbnail(fx_asset):
+    with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as img:
+        with img.clone() as a:
+            a.thumbnail(100, 100)
+            assert a.size == (100, 100)
+        with img.clone() as b:
+            b.thumbnail('100x100')
+            assert b.width <= 100 and b.height == 100
+        with img.clone() as c:
+            c.thumbnail(height=40)
+            assert c.size == (img.width, 40)
+        with raises(TypeError):
+            img.thumbnail('100x100', 100)
+        with raises(ValueError):
+            img.thumbnail(0, 100)
+
+
 @mark.parametrize(('args', 'kwargs', 'expected_size'), [
     ((), {'resize': '200%'}, (1600, 1200)),
     ((), {'resize': '200%x100%'}, (1600, 600)),
@@ -11,7 +11,7 @@ from wand.compat import string_type
 from wand.exceptions import DelegateError
 from wand.font import Font
 from wand.image import Image
-from wand.version import MAGICK_VERSION_NUMBER
+from wand.version import MAGICK_VERSION_NUMBER, QUANTUM_RANGE
 
 
 def test_alpha_channel_get(fx_asset):
@@ -257,6 +257,30 @@ def test_histogram(fx_asset):
         assert h[Color('srgb(0,0,255)')] == 5000
 
 
+def test_histogram_arrays(fx_asset):
+    with Image(filename=str(fx_asset.join('trim-color-test.png'))) as a:
+        samples, counts = a.histogram.arrays()
+        assert len(samples) == len(counts) == 2
+        assert list(counts) == [5000, 5000]
+        assert sorted((int(s.green), int(s.blue)) for s in samples) == [
+            (0, int(QUANTUM_RANGE)),
+            (int(QUANTUM_RANGE), 0)
+        ]
+
+
+def test_histogram_most_common(fx_asset):
+    with Image(filename=str(fx_asset.join('trim-color-test.png'))) as a:
+        a[0, 0] = Color('red')
+        most_common = a.histogram.most_common()
+        assert [count for _, count in most_common] == [5000, 4999, 1]
+        assert most_common[-1] == (Color('srgb(255,0,0)'), 1)
+        assert a.histogram.most_common(1) == most_common[:1]
+        assert a.dominant_colors(2) == most_common[:2]
+        assert len(a.dominant_colors(5, colors=2)) <= 2
+        with raises(ValueError):
+            a.dominant_colors(0)
+
+
 def test_interlace_scheme_get(fx_asset):
     with Image(filename='rose:') as img:
         expected = 'no'
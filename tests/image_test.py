@@ -3,6 +3,7 @@
 # These tests cover the basic I/O & pythonic interfaces of the Image class.
 #
 import codecs
+import gzip
 import io
 import os
 import os.path
@@ -13,7 +14,7 @@ import tempfile
 
 from pytest import mark, raises
 
-from wand.image import ClosedImageError, Image
+from wand.image import ClosedImageError, Image, ImagePool
 from wand.color import Color
 from wand.compat import PY3, text, text_type
 
@@ -141,6 +142,46 @@ def test_new_from_file(fx_asset):
         Image(file='not file object')
 
 
+def test_new_from_stream(fx_asset, monkeypatch):
+    """Opens an image from file objects without fileno()."""
+    blob = fx_asset.join('mona-lisa.jpg').read('rb')
+    compressed = io.BytesIO()
+    with gzip.GzipFile(fileobj=compressed, mode='wb') as f:
+        f.write(blob)
+    compressed.seek(0)
+    with gzip.GzipFile(fileobj=compressed, mode='rb') as f:
+        with Image(file=f) as img:
+            assert img.width == 402
+    strio = io.BytesIO(b'garbage' + blob)
+    strio.seek(7)
+    with Image(file=strio) as img:
+        assert img.width == 402
+    assert strio.tell() == len(blob) + 7
+    # The stream isn't locked by buffer exports afterwards, even where
+    # it's copied instead of read in place.
+    strio.truncate()
+    monkeypatch.setattr('wand.image._READ_IN_PLACE', False)
+    strio.seek(7)
+    with Image(file=strio) as img:
+        assert img.width == 402
+    strio.truncate()
+    # Streams larger than the in-memory limit are spooled to a file.
+    monkeypatch.setattr('wand.image._READ_SPOOL_SIZE', 1024)
+    monkeypatch.setattr('wand.image._READ_CHUNK_SIZE', 1000)
+    compressed.seek(0)
+    with gzip.GzipFile(fileobj=compressed, mode='rb') as f:
+        with Image(file=f) as img:
+            assert img.width == 402
+    # Without fdopen()/fclose() of the C library, they're spooled to a named
+    # file instead, and never truncated.
+    monkeypatch.setattr('wand.image.libc', None)
+    compressed.seek(0)
+    with gzip.GzipFile(fileobj=compressed, mode='rb') as f:
+        with Image(file=f) as img:
+            assert img.width == 402
+        assert f.read() == b''
+
+
 def test_new_from_filename(fx_asset):
     """Opens an image through its filename."""
     with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as img:
@@ -151,6 +192,25 @@ def test_new_from_filename(fx_asset):
         Image(filename=str(fx_asset.join('not-exists.jpg')))
 
 
+def test_read_with_size_hint(fx_asset):
+    with Image() as img:
+        img.read(filename=str(fx_asset.join('mona-lisa.jpg')),
+                 size_hint=(100, 100))
+        assert 100 <= img.width < 402
+        assert img.options['jpeg:size'] is None
+        with raises(TypeError):
+            img.read(filename=str(fx_asset.join('mona-lisa.jpg')),
+                     size_hint=100)
+        # The hint doesn't outlive a failed read.
+        with raises(TypeError):
+            img.read(file='not file object', size_hint=(100, 100))
+        assert img.options['jpeg:size'] is None
+        with raises(IOError):
+            img.read(filename=str(fx_asset.join('not-exists.jpg')),
+                     size_hint=(100, 100))
+        assert img.options['jpeg:size'] is None
+
+
 @mark.skipif(not unicode_filesystem_encoding,
              reason='Unicode filesystem encoding needed')
 def test_new_from_unicode_filename(fx_asset, tmpdir):
@@ -187,6 +247,45 @@ def test_new_from_pseudo(fx_asset):
         assert img.size == (10, 10)
 
 
+def test_new_from_array(fx_asset):
+    with Image(filename=str(fx_asset.join('pixels.png'))) as expected:
+        expected.depth = 8
+        pixels = expected.export_array(channel_map='RGBA', storage='char')
+        with Image.from_array(pixels) as img:
+            assert img.size == (4, 1)
+            assert img.signature == expected.signature
+        with Image.from_array(memoryview(pixels), channel_map='RGBA') as img:
+            assert img.signature == expected.signature
+    with raises(ValueError):
+        Image.from_array(memoryview(b'flat'))
+    with raises(TypeError):
+        Image.from_array(0xDEADBEEF)
+
+
+def test_ping(fx_asset):
+    path = str(fx_asset.join('mona-lisa.jpg'))
+    with Image(filename=path) as expected:
+        size = expected.size
+        resolution = expected.resolution
+    with Image.ping(filename=path) as img:
+        assert img.size == size
+        assert img.format == 'JPEG'
+        assert img.resolution == resolution
+    with fx_asset.join('mona-lisa.jpg').open('rb') as f:
+        with Image.ping(file=f) as img:
+            assert img.size == size
+    blob = fx_asset.join('google.ico').read('rb')
+    with Image.ping(blob=blob, format='ico') as img:
+        assert img.size == (16, 16)
+    with Image() as img:
+        img.read(blob=fx_asset.join('mona-lisa.jpg').read('rb'), ping=True)
+        assert img.size == size
+    with raises(TypeError):
+        Image.ping()
+    with raises(IOError):
+        Image.ping(filename=str(fx_asset.join('not-exists.jpg')))
+
+
 def test_clone(fx_asset):
     """Clones the existing image."""
     funcs = (lambda img: Image(image=img),
@@ -202,6 +301,35 @@ def test_clone(fx_asset):
         img.wand
 
 
+def test_lazy_helpers(fx_asset):
+    with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as img:
+        assert 'options' not in img.__dict__
+        assert 'sequence' not in img.__dict__
+        options = img.options
+        assert img.options is options
+        assert len(img.sequence) == 1
+        assert img.metadata is img.__dict__['metadata']
+        assert img.channel_depths['red'] == 8
+
+
+def test_image_pool(fx_asset):
+    with ImagePool(size=1) as pool:
+        with pool.image(filename=str(fx_asset.join('mona-lisa.jpg'))) as img:
+            wand = img.wand
+            assert img.size == (402, 599)
+        assert len(pool) == 1
+        with pool.image(width=4, height=4, background=Color('red')) as img:
+            assert img.wand == wand
+            assert img.size == (4, 4)
+            assert img[0, 0] == Color('red')
+            with pool.image(width=2, height=2) as img2:
+                assert img2.wand != wand
+        assert len(pool) == 1
+    assert len(pool) == 0
+    with raises(RuntimeError):
+        pool.image(width=1, height=1)
+
+
 def test_save_to_filename(fx_asset):
     """Saves an image to the filename."""
     savefile = os.path.join(tempfile.mkdtemp(), 'savetest.jpg')
@@ -250,6 +378,24 @@ def test_save_to_file(fx_asset):
     buffer.close()
 
 
+def test_save_to_file_in_chunks(fx_asset, monkeypatch):
+    class Writer(object):
+        def __init__(self):
+            self.chunks = []
+
+        def write(self, chunk):
+            self.chunks.append(chunk)
+
+    monkeypatch.setattr('wand.image._WRITE_CHUNK_SIZE', 1024)
+    writer = Writer()
+    with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as orig:
+        orig.save(file=writer)
+        blob = orig.make_blob()
+    assert len(writer.chunks) > 1
+    assert max(len(chunk) for chunk in writer.chunks) == 1024
+    assert b''.join(writer.chunks) == blob
+
+
 def test_save_full_animated_gif_to_file(fx_asset):
     """Save all frames of an animated to a Python file object."""
     temp_filename = os.path.join(tempfile.mkdtemp(), 'savetest.gif')
@@ -283,6 +429,17 @@ def test_make_blob(fx_asset):
         assert img.format == 'JPEG'
         with raises(TypeError):
             img.make_blob(123)
+        with raises(ValueError):
+            img.make_blob('unsupported-format')
+        assert img.format == 'JPEG'
+        assert img.make_blob()[:2] == b'\xff\xd8'
+        # Encoding to a palette format doesn't change the image itself.
+        signature = img.signature
+        colors = len(img.histogram)
+        with Image(blob=img.make_blob('gif')) as gif:
+            assert len(gif.histogram) <= 256
+        assert img.signature == signature
+        assert len(img.histogram) == colors
     svg = b'''
     <svg width="100px" height="100px">
         <circle cx="100" cy="50" r="40" stroke="black"
@@ -341,6 +498,29 @@ def test_iterate(fx_asset):
                 assert i == 299
 
 
+def test_iterate_next_row(fx_asset):
+    """Uses iterator to read compact rows."""
+    with Image(filename=str(fx_asset.join('croptest.png'))) as img:
+        with iter(img) as iterator:
+            row = iterator.next_row(channel_map='A', storage='char')
+            assert len(row) == 300
+            assert row[0][0] == 0
+            iterator.seek(150)
+            row = iterator.next_row(channel_map='RGBA', storage='double')
+            assert list(row[150]) == [0.0, 0.0, 0.0, 1.0]
+            assert row[50][3] == 0.0
+            # Mixed with the Color rows.
+            assert iterator.next()[150] == Color('#000')
+            out = bytearray(300)
+            assert iterator.next_row('A', 'char', out=out) is out
+            assert out[150] == 255
+            assert iterator.cursor == 153
+            iterator.seek(299)
+            iterator.next_row()
+            with raises(StopIteration):
+                iterator.next_row()
+
+
 def test_slice_clone(fx_asset):
     """Clones using slicing."""
     with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as img:
@@ -468,6 +648,14 @@ def test_slice_crop(fx_asset):
             img[290:310, 290:310]
 
 
+def test_array_interface():
+    with Image(filename='rose:') as img:
+        interface = img.__array_interface__
+        assert interface['shape'] == (46, 70, 3)
+        assert interface['typestr'] == '|u1'
+        assert len(interface['data']) == 46
+
+
 def test_equal(fx_asset):
     """Equals (``==``) and not equals (``!=``) operators."""
     with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as a:
@@ -491,6 +679,26 @@ def test_object_hash(fx_asset):
         assert a == b
 
 
+def test_signature_cache(fx_asset):
+    with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as img:
+        signature = img.signature
+        assert img.signature == signature
+        img.negate()
+        negated = img.signature
+        assert negated != signature
+        img[0, 0] = 'red'
+        assert img.signature != negated
+        with Image(width=img.width, height=1) as other:
+            assert img != other
+    with Image(filename=str(fx_asset.join('nocomments.gif'))) as img:
+        first = img.signature
+        with img.sequence.index_context(1):
+            assert img.signature != first
+        assert img.signature == first
+        del img.sequence[0]
+        assert img.signature != first
+
+
 def test_issue_150(fx_asset, tmpdir):
     """Should not be terminated with segmentation fault.
 
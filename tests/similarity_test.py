@@ -0,0 +1,57 @@
+from pytest import mark, raises
+
+from wand.image import Image
+from wand.similarity import (BKTree, average_hash, difference_hash,
+                             hamming_distance, perceptual_hash)
+
+
+@mark.parametrize('function', [average_hash, difference_hash,
+                               perceptual_hash])
+def test_hash(function, fx_asset):
+    with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as img:
+        h = function(img)
+        assert 0 <= h < 2 ** 64
+        with img.clone() as resized:
+            resized.resize(img.width // 2, img.height // 2)
+            assert hamming_distance(h, function(resized)) <= 6
+        with Image(filename=str(fx_asset.join('beach.jpg'))) as other:
+            assert hamming_distance(h, function(other)) > 6
+        assert function(img, hash_size=4) < 2 ** 16
+        with raises(ValueError):
+            function(img, hash_size=1)
+    with raises(TypeError):
+        function('mona-lisa.jpg')
+
+
+@mark.parametrize('function', [average_hash, difference_hash,
+                               perceptual_hash])
+def test_hash_animation(function, fx_asset):
+    """Hashes the first frame of animations."""
+    with Image(filename=str(fx_asset.join('mona-lisa.jpg'))) as first:
+        with Image(filename=str(fx_asset.join('beach.jpg'))) as last:
+            with Image() as animation:
+                animation.sequence.append(first)
+                animation.sequence.append(last)
+                assert function(animation) == function(first)
+
+
+def test_hamming_distance():
+    assert hamming_distance(0b1011, 0b1011) == 0
+    assert hamming_distance(0b1011, 0b0010) == 2
+
+
+def test_bk_tree():
+    tree = BKTree([(0b0000, 'a'), (0b0001, 'b'), (0b0011, 'c')])
+    tree.add(0b1111, 'd')
+    tree.add(0b0001, 'e')
+    assert len(tree) == 5
+    assert sorted(tree) == [(0b0000, 'a'), (0b0001, 'b'), (0b0001, 'e'),
+                            (0b0011, 'c'), (0b1111, 'd')]
+    matches = tree.search(0b0001, max_distance=1)
+    assert matches[:2] in ([(0, 0b0001, 'b'), (0, 0b0001, 'e')],
+                           [(0, 0b0001, 'e'), (0, 0b0001, 'b')])
+    assert sorted(matches[2:]) == [(1, 0b0000, 'a'), (1, 0b0011, 'c')]
+    assert tree.search(0b1110, max_distance=0) == []
+    assert BKTree().search(0, 3) == []
+    with raises(ValueError):
+        tree.search(0, -1)
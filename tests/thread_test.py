@@ -0,0 +1,59 @@
+"""Stress tests of many threads reading, resizing and encoding images at
+once, each with its own :class:`~wand.image.Image` objects.
+
+"""
+import threading
+
+from pytest import mark
+
+from wand.color import Color
+from wand.image import Image
+
+
+def run_threads(target, count=8):
+    errors = []
+
+    def run():
+        try:
+            target()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+@mark.slow
+def test_read_resize_encode(fx_asset):
+    filename = str(fx_asset.join('mona-lisa.jpg'))
+    with open(filename, 'rb') as f:
+        blob = f.read()
+
+    def work():
+        for i in range(10):
+            with Image(blob=blob) as img:
+                img.resize(img.width // 2, img.height // 2)
+                assert img.size == (201, 299)
+                with Image(blob=img.make_blob('png')) as png:
+                    assert png.size == (201, 299)
+            with Image(filename=filename) as img:
+                img.thumbnail('64x64')
+                assert max(img.size) == 64
+                assert img.make_blob('jpeg')
+
+    run_threads(work)
+
+
+@mark.slow
+def test_create_destroy(fx_asset):
+    def work():
+        for i in range(200):
+            with Image(width=8, height=8, background=Color('red')) as img:
+                with img.clone() as cloned:
+                    assert cloned[0, 0] == Color('red')
+
+    run_threads(work, count=16)
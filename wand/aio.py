@@ -0,0 +1,356 @@
+""":mod:`wand.aio` --- :mod:`asyncio` front-end
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+.. versionadded:: 0.5.3
+
+Decoding, transforming and encoding images block for a while, which
+stalls an :mod:`asyncio` event loop.  This module runs them on worker
+threads instead, and lets coroutines await them::
+
+    from wand import aio
+
+    async def make_thumbnail(blob):
+        async with await aio.open(blob=blob) as img:
+            await img.transform(resize='256x256>')
+            return await img.make_blob('jpeg')
+
+Every image is pinned to a single worker thread of an :class:`Executor`
+for its lifetime, since a wand must not be used by many threads at once.
+At most :attr:`Executor.max_pending` operations run or wait on worker
+threads, and at most :attr:`Executor.max_waiting` more are queued on the
+event loop, in order.  Beyond that, operations aren't queued until there's
+room for them, and producers can await :meth:`Executor.ready()` to hold
+off making more requests while the workers are saturated::
+
+    async def make_thumbnails(blobs):
+        for blob in blobs:
+            await executor.ready()
+            asyncio.ensure_future(make_thumbnail(blob))
+
+It requires Python 3.4 or higher.
+
+"""
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import numbers
+
+from .image import Image, _thread_count
+
+__all__ = ('AsyncImage', 'Executor', 'open')
+
+
+class Executor(object):
+    """Worker threads to run image operations on, with backpressure.
+
+    :param workers: the number of worker threads.  default is the number
+                    of CPUs
+    :type workers: :class:`numbers.Integral`
+    :param max_pending: the maximum number of operations submitted to
+                        worker threads at once.  default is twice
+                        ``workers``
+    :type max_pending: :class:`numbers.Integral`
+    :param max_waiting: the maximum number of operations queued beyond
+                        ``max_pending``.  default is ``max_pending``
+    :type max_waiting: :class:`numbers.Integral`
+    :param loop: the event loop.  default is the current event loop
+    :type loop: :class:`asyncio.AbstractEventLoop`
+
+    """
+
+    def __init__(self, workers=None, max_pending=None, max_waiting=None,
+                 loop=None):
+        workers = _thread_count(workers)
+        if max_pending is None:
+            max_pending = 2 * workers
+        elif not isinstance(max_pending, numbers.Integral):
+            raise TypeError('max_pending must be a natural number, not ' +
+                            repr(max_pending))
+        elif max_pending < 1:
+            raise ValueError('max_pending must be a natural number, not ' +
+                             repr(max_pending))
+        if max_waiting is None:
+            max_waiting = max_pending
+        elif not isinstance(max_waiting, numbers.Integral):
+            raise TypeError('max_waiting must be a natural number, not ' +
+                            repr(max_waiting))
+        elif max_waiting < 1:
+            raise ValueError('max_waiting must be a natural number, not ' +
+                             repr(max_waiting))
+        #: (:class:`numbers.Integral`) The maximum number of operations
+        #: submitted to worker threads at once.
+        self.max_pending = max_pending
+        #: (:class:`numbers.Integral`) The maximum number of operations
+        #: queued beyond :attr:`max_pending`.
+        self.max_waiting = max_waiting
+        #: (:class:`numbers.Integral`) The number of operations submitted
+        #: to worker threads.
+        self.pending = 0
+        self.loop = loop
+        self.threads = [concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                        for _ in range(workers)]
+        # The number of open images pinned to every worker thread.
+        self.loads = [0] * workers
+        # The operations beyond max_pending.
+        self.waiting = collections.deque()
+        # The operations and ready() futures waiting for room in the queue,
+        # and the number of places reserved by resolved ready() futures.
+        self.admitting = collections.deque()
+        self.reserved = 0
+
+    def pin(self):
+        """Picks the worker thread with the fewest open images to pin a new
+        image to.
+
+        :returns: the index of the worker thread
+        :rtype: :class:`numbers.Integral`
+
+        """
+        worker = self.loads.index(min(self.loads))
+        self.loads[worker] += 1
+        return worker
+
+    def unpin(self, worker):
+        """Releases an image pinned by :meth:`pin()`.
+
+        :param worker: the index of the worker thread
+        :type worker: :class:`numbers.Integral`
+
+        """
+        self.loads[worker] -= 1
+
+    @property
+    def saturated(self):
+        """(:class:`bool`) Whether the queue is full, so that new
+        operations have to wait for room."""
+        return (self.pending + len(self.waiting) + self.reserved >=
+                self.max_pending + self.max_waiting)
+
+    def ready(self):
+        """Waits until there's room for an operation, and reserves it for
+        the next one.  Producers can await it to be held back while the
+        executor is saturated.  Every reservation has to be followed by an
+        operation, e.g. :func:`open()`, or the room is lost.  It has to be
+        called from the event loop thread.
+
+        :returns: the future of the reservation
+        :rtype: :class:`asyncio.Future`
+
+        """
+        future = asyncio.Future(loop=self.loop or asyncio.get_event_loop())
+        self.admitting.append(future)
+        self._admit()
+        return future
+
+    def submit(self, worker, function, *args, **kwargs):
+        """Schedules ``function(*args, **kwargs)`` on the ``worker`` thread,
+        once there's room for it.  It has to be called from the event loop
+        thread.
+
+        :param worker: the index of the worker thread
+        :type worker: :class:`numbers.Integral`
+        :param function: the function to call
+        :type function: :class:`collections.abc.Callable`
+        :returns: the future of the result
+        :rtype: :class:`asyncio.Future`
+
+        """
+        loop = self.loop or asyncio.get_event_loop()
+        future = asyncio.Future(loop=loop)
+        operation = worker, functools.partial(function, *args, **kwargs), \
+            future, loop
+        if self.reserved:
+            self.reserved -= 1
+            self.waiting.append(operation)
+        else:
+            self.admitting.append(operation)
+            self._admit()
+        self._dispatch()
+        return future
+
+    def _admit(self):
+        while self.admitting and not self.saturated:
+            entry = self.admitting.popleft()
+            if isinstance(entry, asyncio.Future):
+                if not entry.cancelled():
+                    self.reserved += 1
+                    entry.set_result(None)
+            elif not entry[2].cancelled():
+                self.waiting.append(entry)
+
+    def _dispatch(self):
+        while self.waiting and self.pending < self.max_pending:
+            worker, call, future, loop = self.waiting.popleft()
+            if future.cancelled():
+                continue
+            self.pending += 1
+            inner = asyncio.wrap_future(self.threads[worker].submit(call),
+                                        loop=loop)
+            inner.add_done_callback(functools.partial(self._done, future))
+
+    def _done(self, future, inner):
+        self.pending -= 1
+        if future.cancelled():
+            pass
+        elif inner.cancelled():
+            # e.g. by shutdown(wait=False)
+            future.cancel()
+        elif inner.exception() is not None:
+            future.set_exception(inner.exception())
+        else:
+            future.set_result(inner.result())
+        self._admit()
+        self._dispatch()
+
+    def shutdown(self, wait=True):
+        """Stops the worker threads.
+
+        :param wait: whether to wait until running operations finish
+        :type wait: :class:`bool`
+
+        """
+        for thread in self.threads:
+            thread.shutdown(wait=wait)
+
+
+#: (:class:`Executor`) The executor of :func:`open()` if none is given.
+#: It's created at the first use.
+default_executor = None
+
+
+def open(executor=None, **kwargs):
+    """Opens an image on a worker thread.  It takes the same keyword
+    arguments as :class:`~wand.image.Image`::
+
+        img = await aio.open(filename='large.jpg')
+
+    :param executor: the executor to run the image operations on.
+                     default is :data:`default_executor`
+    :type executor: :class:`Executor`
+    :returns: the future of the opened image
+    :rtype: :class:`asyncio.Future`
+
+    """
+    global default_executor
+    if executor is None:
+        if default_executor is None:
+            default_executor = Executor()
+        executor = default_executor
+    elif not isinstance(executor, Executor):
+        raise TypeError('executor must be a wand.aio.Executor instance, '
+                        'not ' + repr(executor))
+    image = AsyncImage(executor, executor.pin())
+    future = executor.submit(image.worker, image._open, kwargs)
+
+    def unpin_on_error(future):
+        if future.cancelled():
+            # The image may have been opened already; it's closed on its
+            # worker thread, after the opening if it's running.
+            closing = executor.submit(image.worker, image._discard)
+            closing.add_done_callback(
+                lambda closing: executor.unpin(image.worker)
+            )
+        elif future.exception() is not None:
+            executor.unpin(image.worker)
+    future.add_done_callback(unpin_on_error)
+    return future
+
+
+class AsyncImage(object):
+    """An :class:`~wand.image.Image` pinned to a worker thread, whose
+    operations return :class:`asyncio.Future` objects.  Use :func:`open()`
+    to make one.  It also works with :keyword:`async with` statement,
+    which closes the image at the end.
+
+    :param executor: the executor to run the image operations on
+    :type executor: :class:`Executor`
+    :param worker: the index of the worker thread to pin the image to
+    :type worker: :class:`numbers.Integral`
+
+    """
+
+    def __init__(self, executor, worker):
+        self.executor = executor
+        self.worker = worker
+        #: (:class:`~wand.image.Image`) The image.  Don't use it from the
+        #: event loop thread.
+        self.image = None
+
+    def _open(self, kwargs):
+        self.image = Image(**kwargs)
+        return self
+
+    def _discard(self):
+        if self.image is not None:
+            self.image.close()
+            self.image = None
+
+    def run(self, function, *args, **kwargs):
+        """Schedules ``function(image, *args, **kwargs)`` on the worker
+        thread of the image, e.g.::
+
+            await img.run(Image.resize, 100, 100)
+
+        :param function: the function to call with the
+                         :class:`~wand.image.Image`
+        :type function: :class:`collections.abc.Callable`
+        :returns: the future of the result
+        :rtype: :class:`asyncio.Future`
+
+        """
+        return self.executor.submit(
+            self.worker,
+            lambda: function(self.image, *args, **kwargs)
+        )
+
+    def transform(self, crop='', resize=''):
+        """Schedules :meth:`~wand.image.BaseImage.transform()`.
+
+        :returns: the future of the completion
+        :rtype: :class:`asyncio.Future`
+
+        """
+        return self.run(Image.transform, crop, resize)
+
+    def make_blob(self, format=None):
+        """Schedules :meth:`~wand.image.Image.make_blob()`.
+
+        :returns: the future of the blob
+        :rtype: :class:`asyncio.Future`
+
+        """
+        return self.run(Image.make_blob, format)
+
+    def save(self, file=None, filename=None):
+        """Schedules :meth:`~wand.image.Image.save()`.
+
+        :returns: the future of the completion
+        :rtype: :class:`asyncio.Future`
+
+        """
+        return self.run(Image.save, file, filename)
+
+    def close(self):
+        """Schedules :meth:`~wand.image.Image.close()`, and unpins the image
+        from its worker thread.  The image is closed even if the future is
+        cancelled.
+
+        :returns: the future of the completion
+        :rtype: :class:`asyncio.Future`
+
+        """
+        future = self.executor.submit(self.worker, self._discard)
+        future.add_done_callback(
+            lambda future: self.executor.unpin(self.worker)
+        )
+        return asyncio.shield(future)
+
+    def __aenter__(self):
+        future = asyncio.Future(loop=self.executor.loop or
+                                asyncio.get_event_loop())
+        future.set_result(self)
+        return future
+
+    def __aexit__(self, type, value, traceback):
+        return self.close()
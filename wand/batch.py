@@ -0,0 +1,221 @@
+""":mod:`wand.batch` --- Batch processing
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+.. versionadded:: 0.5.3
+
+Applies the same chain of operations to many image files on a pool of
+processes, e.g. to make thumbnails of a whole directory::
+
+    from wand.batch import process
+
+    operations = ['auto_orient',
+                  ('transform', {'resize': '256x256>'}),
+                  'strip']
+    for filename, output in process(filenames, operations,
+                                    output='thumbs/{stem}.jpg',
+                                    quality=85):
+        print(filename, '->', output)
+
+Every operation is the name of an :class:`~wand.image.Image` method,
+optionally paired with a :class:`dict` of its keyword arguments.  Every
+worker process decodes, transforms and encodes one image at a time, and
+limits ImageMagick to ``threads`` threads of its own, so that the workers
+don't oversubscribe the CPUs.
+
+.. note::
+
+   As with :mod:`multiprocessing` in general, the main module has to be
+   importable without side effects, i.e. guard the code that calls
+   :func:`process()` with ``if __name__ == '__main__':``.
+
+.. note::
+
+   Worker processes are started with the ``'forkserver'`` method where
+   it's available, and ``'spawn'`` otherwise, rather than forked from
+   the calling process.  By the time :func:`process()` is called,
+   ImageMagick and its OpenMP runtime are usually loaded, and other
+   threads (e.g. of :mod:`wand.aio`) may hold their locks, so forked
+   workers could deadlock.  Python 2 can only fork; avoid using threads
+   of ImageMagick (i.e. ``threads=1``) in the calling process there.
+
+"""
+import collections
+import multiprocessing
+import numbers
+import os.path
+
+from .compat import string_type
+from .image import Image, _thread_count
+from .resource import limits
+
+__all__ = ('process',)
+
+
+def _operation(operation):
+    """Normalizes an operation of :func:`process()` to a
+    ``(method_name, kwargs)`` pair.
+    """
+    if isinstance(operation, string_type):
+        name, kwargs = operation, {}
+    else:
+        try:
+            name, kwargs = operation
+        except (TypeError, ValueError):
+            raise TypeError('operation must be a method name, or a '
+                            '(method_name, kwargs) pair, not ' +
+                            repr(operation))
+        kwargs = dict(kwargs or {})
+    if not isinstance(name, string_type) or name.startswith('_') or \
+            not callable(getattr(Image, name, None)):
+        raise ValueError('operation must be a method of wand.image.Image, '
+                         'not ' + repr(name))
+    return name, kwargs
+
+
+def _pool_context(start_method):
+    """Gets the :mod:`multiprocessing` context to start the worker
+    processes of :func:`process()` with.
+    """
+    if start_method is not None and \
+            not isinstance(start_method, string_type):
+        raise TypeError('start_method must be a string, not ' +
+                        repr(start_method))
+    get_context = getattr(multiprocessing, 'get_context', None)
+    if get_context is None:  # Python 2 can only fork.
+        if start_method not in (None, 'fork'):
+            raise ValueError('start_method must be fork on Python 2, not ' +
+                             repr(start_method))
+        return multiprocessing
+    if start_method is None:
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            start_method = 'forkserver'
+        else:
+            start_method = 'spawn'
+    return get_context(start_method)
+
+
+def _init_worker(threads):
+    """Initializes a worker process of :func:`process()`."""
+    if threads is not None:
+        limits['thread'] = threads
+
+
+def _process_one(index, filename, operations, format, quality, output):
+    """Processes a single file in a worker process of :func:`process()`.
+    Returns the blob, or the written filename if ``output`` is given.
+    """
+    with Image(filename=filename) as img:
+        for name, kwargs in operations:
+            getattr(img, name)(**kwargs)
+        if quality is not None:
+            img.compression_quality = quality
+        if output is None:
+            return img.make_blob(format)
+        base = os.path.basename(filename)
+        stem, ext = os.path.splitext(base)
+        destination = output.format(index=index, filename=base, stem=stem,
+                                    ext=ext)
+        if format is not None:
+            img.format = format
+        img.save(filename=destination)
+        return destination
+
+
+def process(filenames, operations, format=None, quality=None, output=None,
+            workers=None, threads=1, max_pending=2, start_method=None):
+    """Reads every file of ``filenames``, applies ``operations`` to it,
+    and encodes it, on a pool of ``workers`` processes.  Results are
+    streamed back as soon as they're ready, in the same order as
+    ``filenames``.
+
+    :param filenames: the image files to process
+    :type filenames: :class:`collections.abc.Iterable`
+    :param operations: the operations to apply in order.  every operation
+                       is a method name e.g. ``'strip'``, or a
+                       ``(method_name, kwargs)`` pair e.g.
+                       ``('resize', {'width': 100, 'height': 100})``
+    :type operations: :class:`collections.abc.Sequence`
+    :param format: the format to encode to.  default is the format of
+                   each input file
+    :type format: :class:`basestring`
+    :param quality: the :attr:`~wand.image.BaseImage.compression_quality`
+                    to encode with
+    :type quality: :class:`numbers.Integral`
+    :param output: the pattern of filenames to write to instead of
+                   returning blobs, e.g. ``'out/{stem}.png'``.  it's
+                   formatted with ``index``, ``filename`` (without
+                   directory), ``stem`` and ``ext`` (with leading dot)
+    :type output: :class:`basestring`
+    :param workers: the number of processes.  default is the number of
+                    CPUs
+    :type workers: :class:`numbers.Integral`
+    :param threads: the number of threads ImageMagick can use in each
+                    process.  default is 1.  :const:`None` keeps
+                    ImageMagick's own limit
+    :type threads: :class:`numbers.Integral`
+    :param max_pending: the maximum number of images queued per worker.
+                        it bounds the memory taken by results that
+                        weren't consumed yet
+    :type max_pending: :class:`numbers.Integral`
+    :param start_method: the :mod:`multiprocessing` start method of the
+                         worker processes.  default is ``'forkserver'``
+                         where it's available, and ``'spawn'`` otherwise.
+                         ``'fork'`` may deadlock if the calling process
+                         runs other threads
+    :type start_method: :class:`basestring`
+    :returns: ``(filename, result)`` pairs, where ``result`` is the blob,
+              or the written filename if ``output`` is given
+    :rtype: :class:`collections.abc.Iterator`
+    :raises TypeError: when an argument is of a wrong type
+    :raises ValueError: when an operation isn't a method of
+                        :class:`~wand.image.Image`, a number isn't
+                        natural, or the start method is unavailable
+
+    """
+    operations = [_operation(operation) for operation in operations]
+    if format is not None and not isinstance(format, string_type):
+        raise TypeError("format must be a string like 'png' or 'jpeg', "
+                        'not ' + repr(format))
+    if quality is not None and not isinstance(quality, numbers.Integral):
+        raise TypeError('quality must be an integer, not ' + repr(quality))
+    if output is not None and not isinstance(output, string_type):
+        raise TypeError('output must be a string, not ' + repr(output))
+    workers = _thread_count(workers)
+    if threads is not None:
+        if not isinstance(threads, numbers.Integral):
+            raise TypeError('threads must be a natural number, not ' +
+                            repr(threads))
+        elif threads < 1:
+            raise ValueError('threads must be a natural number, not ' +
+                             repr(threads))
+    if not isinstance(max_pending, numbers.Integral):
+        raise TypeError('max_pending must be a natural number, not ' +
+                        repr(max_pending))
+    elif max_pending < 1:
+        raise ValueError('max_pending must be a natural number, not ' +
+                         repr(max_pending))
+    context = _pool_context(start_method)
+    return _process(filenames, operations, format, quality, output,
+                    workers, threads, max_pending, context)
+
+
+def _process(filenames, operations, format, quality, output,
+             workers, threads, max_pending, context):
+    pool = context.Pool(workers, _init_worker, (threads,))
+    try:
+        pending = collections.deque()
+        for index, filename in enumerate(filenames):
+            args = index, filename, operations, format, quality, output
+            pending.append((filename,
+                            pool.apply_async(_process_one, args)))
+            # Keeps at most max_pending images per worker in flight.
+            while len(pending) >= workers * max_pending:
+                filename, result = pending.popleft()
+                yield filename, result.get()
+        while pending:
+            filename, result = pending.popleft()
+            yield filename, result.get()
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
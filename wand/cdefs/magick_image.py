@@ -217,6 +217,7 @@ def load(lib, IM_VERSION):
     lib.MagickConstituteImage.argtypes = [
         c_void_p, c_size_t, c_size_t, c_char_p, c_int, c_void_p
     ]
+    lib.MagickConstituteImage.restype = c_bool
     lib.MagickContrastImage.argtypes = [c_void_p, c_bool]
     lib.MagickContrastImage.restype = c_bool
     lib.MagickContrastStretchImage.argtypes = [c_void_p, c_double, c_double]
@@ -477,6 +478,11 @@ def load(lib, IM_VERSION):
     lib.MagickGetImageScene.restype = c_size_t
     lib.MagickGetImageSignature.argtypes = [c_void_p]
     lib.MagickGetImageSignature.restype = c_magick_char_p
+    if is_im_6:
+        lib.MagickGetImageStatistics = None
+    else:
+        lib.MagickGetImageStatistics.argtypes = [c_void_p]
+        lib.MagickGetImageStatistics.restype = c_void_p
     lib.MagickGetImageTicksPerSecond.argtypes = [c_void_p]
     lib.MagickGetImageTicksPerSecond.restype = c_size_t
     lib.MagickGetImageTotalInkDensity.argtypes = [c_void_p]
@@ -5,6 +5,7 @@
 """
 from ctypes import (POINTER, c_void_p, c_char_p, c_size_t, c_ubyte, c_uint,
                     c_int, c_double)
+from wand.cdefs.magick_image import MagickProgressMonitor
 from wand.cdefs.wandtypes import c_magick_char_p
 
 __all__ = ('load',)
@@ -125,5 +126,9 @@ def load(lib, IM_VERSION):
     lib.MagickSetOption.restype = c_int
     lib.MagickSetPointsize.argtypes = [c_void_p, c_double]
     lib.MagickSetPointsize.restype = c_int
+    lib.MagickSetProgressMonitor.argtypes = [
+        c_void_p, MagickProgressMonitor, c_void_p
+    ]
+    lib.MagickSetProgressMonitor.restype = c_void_p
     lib.MagickSetSize.argtypes = [c_void_p, c_uint, c_uint]
     lib.MagickSetSize.restype = c_int
@@ -7,7 +7,7 @@ from ctypes import POINTER, Structure, c_double, c_int, c_size_t
 from wand.cdefs.wandtypes import c_ssize_t, c_magick_real_t, c_magick_size_t
 
 __all__ = ('AffineMatrix', 'GeomertyInfo', 'KernelInfo', 'MagickPixelPacket',
-           'PixelInfo', 'PointInfo')
+           'PixelInfo', 'PointInfo', 'channel_statistics_structure')
 
 
 class AffineMatrix(Structure):
@@ -98,19 +98,33 @@ class RectangleInfo(Structure):
                 ('y', c_ssize_t)]
 
 
-# All this will change with IM7, so let's not implement this just yet.
-#
-# class ImageChannelStatistics(Structure):
-#     _fields_ = [('maximum', c_double),
-#                 ('minimum', c_double),
-#                 ('mean', c_double),
-#                 ('standard_deviation', c_double),
-#                 ('variance', c_double),
-#                 ('kurtosis', c_double),
-#                 ('skewness', c_double)]
-#
-# class ImageStatistics(Structure):
-#     _fields_ = [('red', ImageChannelStatistics),
-#                 ('green', ImageChannelStatistics),
-#                 ('blue', ImageChannelStatistics),
-#                 ('opacity', ImageChannelStatistics)]
+def channel_statistics_structure(im7=False, entropy=True, median=False):
+    """Builds the ``ChannelStatistics`` structure of the linked library.
+    ImageMagick-7 inserts ``area`` after ``depth``, and later releases
+    appended ``entropy`` & ``median``.  As the library returns an array
+    of these, every field must be declared to get the right stride.
+
+    :param im7: whether the library is ImageMagick-7
+    :type im7: :class:`bool`
+    :param entropy: whether the structure ends with ``entropy``
+    :type entropy: :class:`bool`
+    :param median: whether the structure ends with ``median``
+    :type median: :class:`bool`
+    :returns: the structure type
+    :rtype: :class:`type`
+
+    .. versionadded:: 0.5.3
+    """
+    fields = [('depth', c_size_t)]
+    if im7:
+        fields.append(('area', c_double))
+    fields.extend((name, c_double) for name in (
+        'minima', 'maxima', 'sum', 'sum_squared', 'sum_cubed',
+        'sum_fourth_power', 'mean', 'variance', 'standard_deviation',
+        'kurtosis', 'skewness'
+    ))
+    if entropy:
+        fields.append(('entropy', c_double))
+    if median:
+        fields.append(('median', c_double))
+    return type('ChannelStatistics', (Structure,), {'_fields_': fields})
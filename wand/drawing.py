@@ -1156,8 +1156,10 @@ class Drawing(Resource):
             library.MagickSetIteratorIndex(image.container.wand, image.index)
             res = library.MagickDrawImage(image.container.wand, self.resource)
             library.MagickSetIteratorIndex(image.container.wand, previous)
+            image.container.dirty = True
         else:
             res = library.MagickDrawImage(image.wand, self.resource)
+            image.dirty = True
         if not res:
             self.raise_exception()
 
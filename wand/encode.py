@@ -0,0 +1,104 @@
+""":mod:`wand.encode` --- Concurrent encoding
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+.. versionadded:: 0.5.3
+
+Compressing an image, e.g. to JPEG, WebP or PNG, often takes longer than
+everything else done with it.  :func:`encode_many()` encodes an image to
+several formats or qualities at once, on a pool of threads::
+
+    from wand.encode import encode_many
+    from wand.image import Image
+
+    with Image(filename='photo.jpg') as img:
+        webp, jpeg, thumbnail = encode_many(img, [
+            ('webp', {'quality': 80, 'webp:method': '6'}),
+            'jpeg',
+            ('jpeg', {'quality': 40})
+        ])
+
+It can run encoders in parallel because every output is encoded from its
+own wand, and :mod:`ctypes` releases the GIL during native calls.  Those
+wands are clones of the image, which share its pixels until an encoder
+modifies them.
+
+"""
+import numbers
+
+from .compat import string_type
+from .image import BaseImage, _map_in_threads, _thread_count
+
+__all__ = ('encode_many',)
+
+
+def _output(output):
+    """Normalizes an output of :func:`encode_many()` to a
+    ``(format, options)`` pair.
+    """
+    if isinstance(output, string_type):
+        return output, {}
+    try:
+        fmt, options = output
+    except (TypeError, ValueError):
+        raise TypeError('output must be a format string, or a (format, '
+                        'options) pair, not ' + repr(output))
+    if not isinstance(fmt, string_type):
+        raise TypeError("format must be a string like 'png' or 'jpeg', "
+                        'not ' + repr(fmt))
+    if options is None:
+        options = {}
+    options = dict(options)
+    quality = options.get('quality')
+    if quality is not None and not isinstance(quality, numbers.Integral):
+        raise TypeError('quality must be an integer, not ' + repr(quality))
+    for key, value in options.items():
+        if key != 'quality' and not (isinstance(key, string_type) and
+                                     isinstance(value, string_type)):
+            raise TypeError('options must map strings to strings, not ' +
+                            repr(key) + ': ' + repr(value))
+    return fmt, options
+
+
+def encode_many(image, outputs, workers=None):
+    """Encodes the ``image`` to many ``outputs`` concurrently.
+
+    Every output is either a format string e.g. ``'png'``, or a
+    ``(format, options)`` pair.  The ``'quality'`` option sets
+    :attr:`~wand.image.BaseImage.compression_quality`, and the others are
+    set as :attr:`~wand.image.BaseImage.options` of the encoder, e.g.
+    ``{'quality': 90, 'jpeg:sampling-factor': '4:2:0'}``.
+
+    :param image: the image to encode
+    :type image: :class:`~wand.image.BaseImage`
+    :param outputs: the formats & options to encode to
+    :type outputs: :class:`collections.abc.Iterable`
+    :param workers: the number of threads to encode with.
+                    default is the number of CPUs
+    :type workers: :class:`numbers.Integral`
+    :returns: the blobs in the same order as ``outputs``
+    :rtype: :class:`list`
+    :raises TypeError: when an output or its options are of a wrong type
+    :raises ValueError: when a format is unsupported
+
+    """
+    if not isinstance(image, BaseImage):
+        raise TypeError('image must be a wand.image.BaseImage instance, '
+                        'not ' + repr(image))
+    outputs = [_output(output) for output in outputs]
+    workers = _thread_count(workers)
+    clones = []
+    try:
+        for fmt, options in outputs:
+            clone = image.clone()
+            clones.append(clone)
+            clone.format = fmt
+            for key, value in options.items():
+                if key == 'quality':
+                    clone.compression_quality = value
+                else:
+                    clone.options[key] = value
+        return _map_in_threads(lambda clone: clone.make_blob(), clones,
+                               workers)
+    finally:
+        for clone in clones:
+            clone.close()
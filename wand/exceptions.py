@@ -57,6 +57,16 @@ class WandRuntimeError(WandException, RuntimeError):
     """
 
 
+class WandAbortedError(WandRuntimeError):
+    """An operation was aborted by the progress monitor, e.g. because its
+    deadline passed, or it was cancelled.
+
+    .. seealso:: :meth:`wand.image.BaseImage.monitor()`
+
+    .. versionadded:: 0.5.3
+    """
+
+
 #: (:class:`list`) A list of error/warning domains, these descriptions and
 #: codes. The form of elements is like: (domain name, description, codes).
 DOMAIN_MAP = [
@@ -10,21 +10,39 @@ error happened)::
         print('height =', i.height)
 
 """
+import contextlib
 import ctypes
 import functools
+import hashlib
+import heapq
+import itertools
+import multiprocessing
 import numbers
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
 import weakref
+import zlib
 
 from . import compat
 from .api import libc, libmagick, library
 from .color import Color
 from .compat import (abc, binary, binary_type, encode_filename, file_types,
                      PY3, string_type, text, xrange)
-from .exceptions import MissingDelegateError, WandException, WandRuntimeError
+from .exceptions import (MissingDelegateError, WandAbortedError, WandException,
+                         WandRuntimeError)
 from .font import Font
-from .resource import DestroyedResourceError, Resource
-from .cdefs.structures import GeomertyInfo
-from .version import MAGICK_VERSION_NUMBER, MAGICK_HDRI
+from .resource import (DestroyedResourceError, Resource, decrement_refcount,
+                       increment_refcount)
+from .cdefs.magick_image import MagickProgressMonitor
+from .cdefs.structures import (GeomertyInfo, MagickPixelPacket, PixelInfo,
+                               channel_statistics_structure)
+from .version import (MAGICK_HDRI, MAGICK_VERSION_INFO, MAGICK_VERSION_NUMBER,
+                      QUANTUM_DEPTH)
 
 
 __all__ = ('ALPHA_CHANNEL_TYPES', 'CHANNELS', 'COLORSPACE_TYPES',
@@ -36,9 +54,9 @@ __all__ = ('ALPHA_CHANNEL_TYPES', 'CHANNELS', 'COLORSPACE_TYPES',
            'PIXEL_INTERPOLATE_METHODS',
            'STORAGE_TYPES', 'VIRTUAL_PIXEL_METHOD', 'UNIT_TYPES',
            'BaseImage', 'ChannelDepthDict', 'ChannelImageDict',
-           'ClosedImageError', 'HistogramDict', 'Image', 'ImageProperty',
-           'Iterator', 'Metadata', 'OptionDict', 'manipulative',
-           'ArtifactTree', 'ProfileDict')
+           'ClosedImageError', 'HistogramDict', 'Image', 'ImagePool',
+           'ImageProperty', 'Iterator', 'Metadata', 'OptionDict',
+           'manipulative', 'ArtifactTree', 'ProfileDict')
 
 
 #: (:class:`tuple`) The list of alpha channel types
@@ -823,6 +841,324 @@ STORAGE_TYPES = ('undefined', 'char', 'double', 'float', 'integer',
                  'long', 'quantum', 'short')
 
 
+# The C type of a single ``'quantum'`` value depends on how the linked
+# library was configured.  See MagickCore/magick-type.h.
+if MAGICK_HDRI:
+    _c_quantum = ctypes.c_float if QUANTUM_DEPTH <= 16 else ctypes.c_double
+else:
+    _c_quantum = {8: ctypes.c_ubyte,
+                  16: ctypes.c_ushort,
+                  32: ctypes.c_uint}.get(QUANTUM_DEPTH, ctypes.c_double)
+
+# Streams that aren't files are read in memory up to this size, and spooled
+# to a temporary file in chunks of :data:`_READ_CHUNK_SIZE` bytes beyond it.
+_READ_SPOOL_SIZE = 8 * 1024 * 1024
+_READ_CHUNK_SIZE = 1024 * 1024
+
+# In-memory streams are read in place only where ctypes objects are freed
+# as soon as they're unreferenced, since their buffer exports lock the
+# stream until then.  Elsewhere (e.g. PyPy) they're copied once instead.
+_READ_IN_PLACE = platform.python_implementation() == 'CPython'
+
+# Encoded images are written to file objects without fileno() in chunks of
+# this size, rather than copying the whole blob at once.
+_WRITE_CHUNK_SIZE = 1024 * 1024
+
+# :meth:`BaseImage.fingerprint()` exports and hashes pixels by bands of rows
+# of at most this many bytes.
+_FINGERPRINT_BAND_SIZE = 4 * 1024 * 1024
+
+# :meth:`BaseImage.renditions()` derives a rendition from a smaller one than
+# the original only if it's at least this many times larger on both axes,
+# so that progressive resizing doesn't pile up visible resampling errors.
+_RENDITION_MIN_RATIO = 2
+
+# The keys :meth:`BaseImage.renditions()` understands in each spec.
+_RENDITION_KEYS = frozenset(['width', 'height', 'format', 'quality',
+                             'filename'])
+
+# The C types ImageMagick reads & writes for each of :const:`STORAGE_TYPES`.
+# Both ``IntegerPixel`` & ``LongPixel`` are 32-bit unsigned integers.
+_STORAGE_CTYPES = (None, ctypes.c_ubyte, ctypes.c_double, ctypes.c_float,
+                   ctypes.c_uint, ctypes.c_uint, _c_quantum, ctypes.c_ushort)
+
+# The ChannelStatistics structure of the linked library.  ImageMagick
+# 6.8.9-8 appended ``entropy``, and 7.0.10-0 appended ``median``.
+if MAGICK_VERSION_NUMBER < 0x700:
+    _ChannelStatistics = channel_statistics_structure(
+        entropy=MAGICK_VERSION_INFO >= (6, 8, 9, 8)
+    )
+    # Statistics are indexed by ChannelType flags.  ImageMagick-6 has
+    # the opacity channel, i.e. inverted alpha, instead of alpha.
+    _STATISTICS_CHANNELS = dict(red=1, gray=1, cyan=1, green=2, magenta=2,
+                                blue=4, yellow=4, opacity=8, black=32)
+    _STATISTICS_ALPHA = 'opacity'
+else:
+    _ChannelStatistics = channel_statistics_structure(
+        im7=True,
+        median=MAGICK_VERSION_INFO >= (7, 0, 10, 0)
+    )
+    # Statistics are indexed by PixelChannel.
+    _STATISTICS_CHANNELS = dict(red=0, gray=0, cyan=0, green=1, magenta=1,
+                                blue=2, yellow=2, black=3, alpha=4)
+    _STATISTICS_ALPHA = 'alpha'
+
+# Functions to get the normalized value of a :class:`~wand.color.Color`
+# for each ``channel_map`` letter.
+_CHANNEL_GETTERS = {
+    'R': lambda color: color.red,
+    'G': lambda color: color.green,
+    'B': lambda color: color.blue,
+    'A': lambda color: color.alpha,
+    'O': lambda color: 1.0 - color.alpha,
+    'C': lambda color: color.red,
+    'M': lambda color: color.green,
+    'Y': lambda color: color.blue,
+    'K': lambda color: color.black,
+    'I': lambda color: color.red,
+    'P': lambda color: 0.0
+}
+
+
+def _storage_typestr(storage):
+    """Builds a NumPy array interface ``typestr`` (e.g. ``'<f8'``) for
+    one of :const:`STORAGE_TYPES`.
+
+    :param storage: the storage type name.
+    :type storage: :class:`basestring`
+    :rtype: :class:`str`
+
+    .. versionadded:: 0.5.3
+    """
+    c_type = _STORAGE_CTYPES[STORAGE_TYPES.index(storage)]
+    size = ctypes.sizeof(c_type)
+    if size == 1:
+        return '|u1'
+    kind = 'f' if c_type in (ctypes.c_float, ctypes.c_double) else 'u'
+    order = '<' if sys.byteorder == 'little' else '>'
+    return '{0}{1}{2}'.format(order, kind, size)
+
+
+def _buffer_storage(buffer):
+    """Guesses which of :const:`STORAGE_TYPES` matches the item type of
+    the given ``buffer``.  Objects exposing the NumPy array interface are
+    read through their ``typestr``, and all other objects through
+    :class:`memoryview`.
+
+    :param buffer: an object supporting the buffer protocol.
+    :returns: the storage type name, or ``None`` if the item type isn't
+              supported by ImageMagick, e.g. signed integers, or integers
+              in the non-native byte order.
+    :rtype: :class:`basestring`
+
+    .. versionadded:: 0.5.3
+    """
+    foreign_order = '>!' if sys.byteorder == 'little' else '<'
+    interface = getattr(buffer, '__array_interface__', None)
+    if interface is not None:
+        typestr = interface['typestr']
+        if typestr[0] in foreign_order and typestr[2:] != '1':
+            return None
+        kind, size = typestr[1], int(typestr[2:])
+    else:
+        view = memoryview(buffer)
+        if view.format[:1] in foreign_order and view.itemsize > 1:
+            return None
+        fmt = view.format.lstrip('@=<>!')
+        if fmt in ('f', 'd'):
+            kind = 'f'
+        elif fmt in ('B', 'H', 'I', 'L', 'Q', 'c'):
+            kind = 'u'
+        else:
+            return None
+        size = view.itemsize
+    return {('u', 1): 'char', ('u', 2): 'short', ('u', 4): 'integer',
+            ('f', 4): 'float', ('f', 8): 'double'}.get((kind, size))
+
+
+def _buffer_shape(buffer):
+    """Gets the shape of the given ``buffer``.
+
+    :param buffer: an object supporting the buffer protocol.
+    :rtype: :class:`tuple`
+
+    .. versionadded:: 0.5.3
+    """
+    interface = getattr(buffer, '__array_interface__', None)
+    if interface is not None:
+        return tuple(interface['shape'])
+    return tuple(memoryview(buffer).shape)
+
+
+def _new_pixel_buffer(channel_map, storage, columns, rows=None):
+    """Allocates a zero-filled :mod:`ctypes` array for exporting pixels,
+    shaped ``(rows, columns, channels)``, or ``(columns, channels)`` if
+    ``rows`` is omitted.
+
+    :param channel_map: a string listing the channel data format for
+                        each pixel.
+    :type channel_map: :class:`basestring`
+    :param storage: one of :const:`STORAGE_TYPES`.
+    :type storage: :class:`basestring`
+    :param columns: the number of pixels in each row.
+    :type columns: :class:`numbers.Integral`
+    :param rows: the number of rows.
+    :type rows: :class:`numbers.Integral`
+    :rtype: :class:`ctypes.Array`
+
+    .. versionadded:: 0.5.3
+    """
+    if not isinstance(channel_map, string_type):
+        raise TypeError('channel_map must be a string, not ' +
+                        repr(channel_map))
+    if storage not in STORAGE_TYPES[1:]:
+        raise ValueError('storage must be a value from STORAGE_TYPES, '
+                         ' not ' + repr(storage))
+    c_storage = _STORAGE_CTYPES[STORAGE_TYPES.index(storage)]
+    c_type = c_storage * len(channel_map) * columns
+    if rows is not None:
+        c_type *= rows
+    return c_type()
+
+
+def _read_at_most(file, size):
+    """Reads from ``file`` until ``size`` bytes are read, or the stream
+    ends.  Unlike ``file.read(size)``, it doesn't stop at short reads of
+    e.g. sockets or pipes.
+
+    :param file: a readable file object
+    :type file: file object
+    :param size: the number of bytes to read
+    :type size: :class:`numbers.Integral`
+    :returns: at most ``size`` bytes
+    :rtype: :class:`bytes`
+
+    .. versionadded:: 0.5.3
+    """
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = file.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    if len(chunks) == 1:
+        return chunks[0]
+    return b''.join(chunks)
+
+
+def _thread_count(workers):
+    """Validates the number of worker threads, which defaults to the number
+    of CPUs.
+
+    :param workers: the number of threads, or :const:`None`
+    :type workers: :class:`numbers.Integral`
+    :returns: the number of threads
+    :rtype: :class:`numbers.Integral`
+
+    .. versionadded:: 0.5.3
+    """
+    if workers is None:
+        try:
+            return multiprocessing.cpu_count()
+        except NotImplementedError:
+            return 1
+    elif not isinstance(workers, numbers.Integral):
+        raise TypeError('workers must be a natural number, not ' +
+                        repr(workers))
+    elif workers < 1:
+        raise ValueError('workers must be a natural number, not ' +
+                         repr(workers))
+    return workers
+
+
+def _map_in_threads(function, items, workers):
+    """Calls ``function`` with every item on up to ``workers`` threads,
+    including the calling one.  Since :mod:`ctypes` releases the GIL
+    during native calls, encoders of different wands run in parallel.
+
+    :param function: the function to call with every item
+    :type function: :class:`collections.abc.Callable`
+    :param items: the items to pass
+    :type items: :class:`collections.abc.Sequence`
+    :param workers: the maximum number of threads
+    :type workers: :class:`numbers.Integral`
+    :returns: the results in the same order as ``items``
+    :rtype: :class:`list`
+    :raises Exception: the first error raised by ``function``.
+                       no more items are started after it
+
+    .. versionadded:: 0.5.3
+    """
+    results = [None] * len(items)
+    # list.pop() is atomic, so that it can be shared by the threads.
+    pending = list(reversed(xrange(len(items))))
+    errors = []
+
+    def work():
+        while not errors:
+            try:
+                i = pending.pop()
+            except IndexError:
+                return
+            try:
+                results[i] = function(items[i])
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=work)
+               for _ in xrange(min(workers, len(items)) - 1)]
+    for thread in threads:
+        thread.start()
+    work()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def _readable_buffer(buffer):
+    """Gets a pointer to the memory of ``buffer`` that can be passed to
+    a ``void *`` parameter, without unpacking its values into Python
+    objects.  Read-only buffers that don't expose their address (e.g.
+    a read-only :class:`memoryview`) are copied once natively.
+
+    :param buffer: a C-contiguous object supporting the buffer protocol.
+    :returns: a pair of the pointer, and the size of the buffer in bytes.
+    :rtype: :class:`tuple`
+    :raises TypeError: if ``buffer`` doesn't support the buffer protocol.
+    :raises ValueError: if ``buffer`` isn't C-contiguous.
+
+    .. versionadded:: 0.5.3
+    """
+    if isinstance(buffer, binary_type):
+        return buffer, len(buffer)
+    interface = getattr(buffer, '__array_interface__', None)
+    if interface is not None:
+        if interface.get('strides') is not None:
+            raise ValueError('buffer must be C-contiguous')
+        nbytes = int(interface['typestr'][2:])
+        for dimension in interface['shape']:
+            nbytes *= dimension
+        data = interface['data']
+        if isinstance(data, tuple):
+            return data[0], nbytes
+    view = memoryview(buffer)
+    nbytes = view.itemsize
+    for dimension in view.shape:
+        nbytes *= dimension
+    c_buffer_type = ctypes.c_char * nbytes
+    try:
+        try:
+            return c_buffer_type.from_buffer(buffer), nbytes
+        except TypeError:
+            return c_buffer_type.from_buffer_copy(view), nbytes
+    except BufferError:
+        raise ValueError('buffer must be C-contiguous')
+
+
 #: (:class:`tuple`) The list of resolution unit types.
 #:
 #: - ``'undefined'``
@@ -884,6 +1220,78 @@ def manipulative(function):
     return wrapped
 
 
+# The progress monitors of :meth:`BaseImage.monitor()` blocks in effect, by
+# the keys passed to ImageMagick as client data.  A single C callback
+# dispatches to them, so that clones of a monitored image never call
+# a freed callback; they find no monitor, and go on.
+_progress_monitors = {}
+_progress_monitor_keys = itertools.count(1)
+
+
+def _dispatch_progress(tag, offset, span, client_data):
+    monitor = _progress_monitors.get(client_data)
+    if monitor is None:
+        return True
+    return monitor(tag, offset, span)
+
+
+_c_progress_monitor = MagickProgressMonitor(_dispatch_progress)
+
+
+def _cancellable(function):
+    """The decorator that adds ``deadline`` and ``cancel_event`` keyword
+    arguments to a long operation, which abort it through
+    :meth:`BaseImage.monitor()`.
+
+    .. versionadded:: 0.5.3
+    """
+
+    @functools.wraps(function)
+    def wrapped(self, *args, **kwargs):
+        deadline = kwargs.pop('deadline', None)
+        cancel_event = kwargs.pop('cancel_event', None)
+        if deadline is None and cancel_event is None:
+            return function(self, *args, **kwargs)
+        with self.monitor(deadline=deadline, cancel_event=cancel_event):
+            return function(self, *args, **kwargs)
+    return wrapped
+
+
+def _sequence(image):
+    """Makes the :class:`~wand.sequence.Sequence` of the ``image``.  It's
+    imported lazily, because :mod:`wand.sequence` imports this module.
+    """
+    from .sequence import Sequence
+    return Sequence(image)
+
+
+class _LazyHelper(object):
+    """Creates a helper object of an image, e.g. :class:`OptionDict`, at the
+    first access to the attribute, instead of whenever an image is made.
+    It's a non-data descriptor, so that the helper object is cached in
+    the instance attribute of the same name.
+
+    :param name: the attribute name
+    :type name: :class:`str`
+    :param factory: the function that makes the helper object of an image
+    :type factory: :class:`collections.abc.Callable`
+
+    .. versionadded:: 0.5.3
+
+    """
+
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+
+    def __get__(self, image, owner=None):
+        if image is None:
+            return self
+        helper = self.factory(image)
+        image.__dict__[self.name] = helper
+        return helper
+
+
 class BaseImage(Resource):
     """The abstract base of :class:`Image` (container) and
     :class:`~wand.sequence.SingleImage`.  That means the most of
@@ -903,7 +1311,22 @@ class BaseImage(Resource):
     #:
     #: .. versionchanged:: 0.3.9
     #:    Added ``'pdf:use-cropbox'`` option.
-    options = None
+    options = _LazyHelper('options', lambda image: OptionDict(image))
+
+    #: (:class:`ChannelImageDict`) The mapping of separated channels
+    #: from the image. ::
+    #:
+    #:     with image.channel_images['red'] as red_image:
+    #:         display(red_image)
+    channel_images = _LazyHelper('channel_images',
+                                 lambda image: ChannelImageDict(image))
+
+    #: (:class:`ChannelDepthDict`) The mapping of channels to their depth.
+    #: Read only.
+    #:
+    #: .. versionadded:: 0.3.0
+    channel_depths = _LazyHelper('channel_depths',
+                                 lambda image: ChannelDepthDict(image))
 
     #: (:class:`collections.abc.Sequence`) The list of
     #: :class:`~wand.sequence.SingleImage`\ s that the image contains.
@@ -911,9 +1334,6 @@ class BaseImage(Resource):
     #: .. versionadded:: 0.3.0
     sequence = None
 
-    #: (:class:`bool`) Whether the image is changed or not.
-    dirty = None
-
     c_is_resource = library.IsMagickWand
     c_destroy_resource = library.DestroyMagickWand
     c_get_exception = library.MagickGetException
@@ -921,15 +1341,49 @@ class BaseImage(Resource):
 
     __slots__ = '_wand',
 
+    _dirty = None
+
+    #: The cached ``(iterator index, signature)`` pair of :attr:`signature`.
+    _signature = None
+
+    #: The key of the innermost :meth:`monitor()` block in effect.
+    _progress_monitor_key = None
+
     def __init__(self, wand):
         self.wand = wand
-        self.channel_images = ChannelImageDict(self)
-        self.channel_depths = ChannelDepthDict(self)
-        self.options = OptionDict(self)
         self.dirty = False
 
+    def _region(self, region):
+        """Validates a ``(x, y, width, height)`` region of the image.
+
+        :param region: the region to validate
+        :type region: :class:`collections.abc.Sequence`
+        :returns: the region as a tuple
+        :rtype: :class:`tuple`
+        :raises TypeError: when ``region`` isn't four integers
+        :raises ValueError: when ``region`` is out of the image
+
+        .. versionadded:: 0.5.3
+
+        """
+        if not (isinstance(region, abc.Sequence) and len(region) == 4):
+            raise TypeError('region must be a (x, y, width, height) '
+                            'sequence, not ' + repr(region))
+        x, y, width, height = region
+        if not all(isinstance(v, numbers.Integral) for v in region):
+            raise TypeError('region must consist of integers, not ' +
+                            repr(region))
+        elif x < 0 or y < 0 or width < 1 or height < 1:
+            raise ValueError('region is out of the image: ' + repr(region))
+        elif x + width > self.width or y + height > self.height:
+            raise ValueError('region is out of the image: ' + repr(region))
+        return x, y, width, height
+
     def __eq__(self, other):
         if isinstance(other, type(self)):
+            # Comparing sizes is much cheaper than hashing every pixel.
+            if self.size != other.size:
+                return False
             return self.signature == other.signature
         return False
 
@@ -949,25 +1403,7 @@ class BaseImage(Resource):
                 elif not x_slice and y_slice:
                     x = slice(x, x + 1)
                 elif not (x_slice or y_slice):
-                    if not (isinstance(x, numbers.Integral) and
-                            isinstance(y, numbers.Integral)):
-                        raise TypeError('x and y must be integral, not ' +
-                                        repr((x, y)))
-                    if x < 0:
-                        x += self.width
-                    if y < 0:
-                        y += self.height
-                    if x >= self.width:
-                        raise IndexError('x must be less than width')
-                    elif y >= self.height:
-                        raise IndexError('y must be less than height')
-                    elif x < 0:
-                        raise IndexError('x cannot be less than 0')
-                    elif y < 0:
-                        raise IndexError('y cannot be less than 0')
-                    with iter(self) as iterator:
-                        iterator.seek(y)
-                        return iterator.next(x)
+                    return self.get_pixels([(x, y)])[0]
                 if not (x.step is None and y.step is None):
                     raise ValueError('slicing with step is unsupported')
                 elif (x.start is None and x.stop is None and
@@ -998,9 +1434,7 @@ class BaseImage(Resource):
         raise TypeError('unsupported index type: ' + repr(idx))
 
     def __setitem__(self, idx, color):
-        if isinstance(color, string_type):
-            color = Color(color)
-        elif not isinstance(color, Color):
+        if not isinstance(color, (string_type, Color)):
             raise TypeError('color must be in instance of Color, not ' +
                             repr(color))
         if not isinstance(idx, abc.Iterable):
@@ -1010,52 +1444,10 @@ class BaseImage(Resource):
         if len(idx) != 2:
             msg = 'pixel index can not be {0}-dimensional'.format(len(idx))
             raise ValueError(msg)
-        colorspace = self.colorspace
-        s_index = STORAGE_TYPES.index("double")
-        width, height = self.size
-        x1, y1 = idx
-        x2, y2 = 1, 1
-        if not (isinstance(x1, numbers.Integral) and
-                isinstance(y1, numbers.Integral)):
-            raise TypeError('Expecting x & y to be integers')
-        if x1 < 0:
-            x1 += width
-        if y1 < 0:
-            y1 += height
-        if x1 >= width:
-            raise ValueError('x must be less then image width')
-        elif y1 >= height:
-            raise ValueError('y must be less then image height')
-        if colorspace == 'gray':
-            channel_map = b'I'
-            pixel = (ctypes.c_double * 1)()
-            pixel[0] = color.red
-        elif colorspace == 'cmyk':
-            channel_map = b'CMYK'
-            pixel = (ctypes.c_double * 5)()
-            pixel[0] = color.red
-            pixel[1] = color.green
-            pixel[2] = color.blue
-            pixel[3] = color.black
-            if self.alpha_channel:
-                channel_map += b'A'
-                pixel[4] = color.alpha
-        else:
-            channel_map = b'RGB'
-            pixel = (ctypes.c_double * 4)()
-            pixel[0] = color.red
-            pixel[1] = color.green
-            pixel[2] = color.blue
-            if self.alpha_channel:
-                channel_map += b'A'
-                pixel[3] = color.alpha
-        r = library.MagickImportImagePixels(self.wand,
-                                            x1, y1, x2, y2,
-                                            channel_map,
-                                            s_index,
-                                            ctypes.byref(pixel))
-        if not r:
-            self.raise_exception()
+        try:
+            self.set_pixels([idx], color)
+        except IndexError as e:
+            raise ValueError(str(e))
 
     def __hash__(self):
         return hash(self.signature)
@@ -1097,30 +1489,28 @@ class BaseImage(Resource):
             with Image(filename='rose:') as img:
                 img_data = numpy.asarray(img)
 
+        The array has ``(height, width, channels)`` shape, and 8-bit
+        ``'RGB'`` or ``'RGBA'`` values.  Use :meth:`export_array()` to
+        choose other channels & storage types, or to reuse an existing
+        array.
+
         :raises ValueError: if image has no data.
 
         .. versionadded:: 0.5.0
+
+        .. versionchanged:: 0.5.3
+           The shape is ``(height, width, channels)`` instead of
+           ``(width, height, channels)``.
         """
         if not self.signature:
             raise ValueError("No image data to interface with.")
         width, height = self.size
-        storage_type = 1  # CharPixel
-        channel_format = binary("RGB")
-        channel_number = 3
-        if self.alpha_channel:
-            channel_format = binary("RGBA")
-            channel_number = 4
-        c_buffer = (width * height * channel_number * ctypes.c_char)()
-        # FIXME: Move to pixel-data import/export methods.
-        r = library.MagickExportImagePixels(self.wand,
-                                            0, 0, width, height,
-                                            channel_format, storage_type,
-                                            ctypes.byref(c_buffer))
-        if not r:
-            self.raise_exception()
+        channel_map = 'RGBA' if self.alpha_channel else 'RGB'
+        c_buffer = self.export_array(channel_map=channel_map, storage='char')
         return dict(data=c_buffer,
-                    shape=(width, height, channel_number),
-                    typestr='|u1')
+                    shape=(height, width, len(channel_map)),
+                    typestr=_storage_typestr('char'),
+                    version=3)
 
     @property
     def alpha_channel(self):
@@ -1412,6 +1802,23 @@ class BaseImage(Resource):
         if not r:
             raise self.raise_exception()
 
+    @property
+    def dirty(self):
+        """(:class:`bool`) Whether the image is changed or not.
+
+        .. versionchanged:: 0.5.3
+           Setting it to :const:`True` discards the cached
+           :attr:`signature`.
+
+        """
+        return self._dirty
+
+    @dirty.setter
+    def dirty(self, dirty):
+        self._dirty = dirty
+        if dirty:
+            self._signature = None
+
     @property
     def dispose(self):
         """(:class:`basestring`) Controls how the image data is
@@ -1943,9 +2350,15 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.1.9
 
+        .. versionchanged:: 0.5.3
+           The digest is cached until the image is changed.
+
         """
-        signature = library.MagickGetImageSignature(self.wand)
-        return text(signature.value)
+        index = library.MagickGetIteratorIndex(self.wand)
+        if self._signature is None or self._signature[0] != index:
+            signature = library.MagickGetImageSignature(self.wand)
+            self._signature = index, text(signature.value)
+        return self._signature[1]
 
     @property
     def size(self):
@@ -2063,6 +2476,7 @@ class BaseImage(Resource):
             self.resource = wand
         except TypeError:
             raise TypeError(repr(wand) + ' is not a MagickWand instance')
+        self._signature = None
 
     @wand.deleter
     def wand(self):
@@ -2197,6 +2611,7 @@ class BaseImage(Resource):
         if not r:
             self.raise_exception()
 
+    @manipulative
     def border(self, color, width, height, compose="copy"):
         """Surrounds the image with a border.
 
@@ -2306,6 +2721,80 @@ class BaseImage(Resource):
             textboard.read(filename=b'caption:' + text.encode('utf-8'))
             self.composite(textboard, left, top)
 
+    def channel_statistics(self, region=None):
+        """Computes the statistics of every channel of the image, e.g.
+        their mean, standard deviation, minimum & maximum, with a single
+        :c:func:`MagickGetImageChannelStatistics` (or
+        :c:func:`MagickGetImageStatistics` with ImageMagick-7) call::
+
+            with Image(filename='photo.jpg') as img:
+                stats = img.channel_statistics()
+                print(stats['red'].mean, stats['red'].standard_deviation)
+                corner = img.channel_statistics(region=(0, 0, 64, 64))
+
+        Each value is a :mod:`ctypes` structure, with ``depth``, ``minima``,
+        ``maxima``, ``sum``, ``sum_squared``, ``sum_cubed``,
+        ``sum_fourth_power``, ``mean``, ``variance``, ``standard_deviation``,
+        ``kurtosis`` & ``skewness`` fields.  ImageMagick-7 also has
+        ``area``, i.e. the number of pixels, and ``entropy`` & ``median``
+        fields are there since ImageMagick 6.8.9-8 & 7.0.10-0 respectively.
+        Values are in the quantum range, i.e. between 0 and
+        :const:`~wand.version.QUANTUM_RANGE`.
+
+        :param region: an optional ``(x, y, width, height)`` region to
+                       compute statistics of, without cloning the whole
+                       image.  default is the whole image
+        :type region: :class:`collections.abc.Sequence`
+        :returns: the statistics by channel names, e.g. ``'red'``,
+                  ``'green'``, ``'blue'`` & ``'alpha'``.  ``'gray'`` for
+                  grayscale images, and ``'cyan'``, ``'magenta'``,
+                  ``'yellow'`` & ``'black'`` for CMYK images.  with
+                  ImageMagick-6, ``'opacity'`` instead of ``'alpha'``,
+                  whose values are inverted, i.e. 0 is opaque
+        :rtype: :class:`dict`
+
+        .. versionadded:: 0.5.3
+
+        """
+        colorspace = self.colorspace
+        if colorspace == 'gray':
+            names = ['gray']
+        elif colorspace == 'cmyk':
+            names = ['cyan', 'magenta', 'yellow', 'black']
+        else:
+            names = ['red', 'green', 'blue']
+        if self.alpha_channel:
+            names.append(_STATISTICS_ALPHA)
+        wand = self.wand
+        if region is not None:
+            x, y, width, height = self._region(region)
+            wand = library.MagickGetImageRegion(self.wand, width, height,
+                                                x, y)
+            if not wand:
+                self.raise_exception()
+        try:
+            if library.MagickGetImageStatistics:
+                statistics_p = library.MagickGetImageStatistics(wand)
+            else:
+                statistics_p = library.MagickGetImageChannelStatistics(wand)
+        finally:
+            if region is not None:
+                library.DestroyMagickWand(wand)
+        if not statistics_p:
+            self.raise_exception()
+        try:
+            statistics = ctypes.cast(statistics_p,
+                                     ctypes.POINTER(_ChannelStatistics))
+            return dict(
+                (name, _ChannelStatistics.from_buffer_copy(
+                    statistics[_STATISTICS_CHANNELS[name]]
+                ))
+                for name in names
+            )
+        finally:
+            library.MagickRelinquishMemory(statistics_p)
+
+    @manipulative
     def clamp(self):
         """Restrict color values between 0 and quantum range. This is useful
         when applying arithmetic operations that could result in color values
@@ -2399,6 +2888,7 @@ class BaseImage(Resource):
                                                      ctypes.byref(distortion))
         return Image(BaseImage(compared_image)), distortion.value
 
+    @manipulative
     def composite(self, image, left, top):
         """Places the supplied ``image`` over the current image, with the top
         left corner of ``image`` at coordinates ``left``, ``top`` of the
@@ -2691,6 +3181,56 @@ class BaseImage(Resource):
             if reset_coords:
                 self.reset_coords()
 
+    def crop_many(self, boxes):
+        """Crops many regions out of the image at once.  Unlike cropping
+        a :meth:`clone()` for every region, or slicing the image, only the
+        pixels of each region are copied, so it's much cheaper to cut
+        many small regions out of a large image::
+
+            faces = img.crop_many([(120, 80, 64, 64), (300, 96, 60, 60)])
+            try:
+                for i, face in enumerate(faces):
+                    face.save(filename='face-{0}.png'.format(i))
+            finally:
+                for face in faces:
+                    face.close()
+
+        Only the current frame of an animation is cropped.
+
+        :param boxes: ``(x, y, width, height)`` regions to crop
+        :type boxes: :class:`collections.abc.Iterable`
+        :returns: a new image for every region, in the same order.
+                  the caller is responsible to close them
+        :rtype: :class:`list`
+        :raises TypeError: when a box isn't four integers
+        :raises ValueError: when a box is out of the image
+
+        .. versionadded:: 0.5.3
+
+        """
+        boxes = [self._region(box) for box in boxes]
+        images = []
+        try:
+            for x, y, width, height in boxes:
+                wand = library.MagickGetImageRegion(self.wand, width, height,
+                                                    x, y)
+                if not wand:
+                    self.raise_exception()
+                library.MagickResetImagePage(wand, None)
+                # The region wand is taken over as is, without cloning it.
+                try:
+                    image = Image()
+                except:  # noqa: E722
+                    library.DestroyMagickWand(wand)
+                    raise
+                images.append(image)
+                image.wand = wand
+        except:  # noqa: E722
+            for image in images:
+                image.close()
+            raise
+        return images
+
     @manipulative
     def deconstruct(self):
         """Iterates over internal image stack, and adjust each frame size to
@@ -2731,6 +3271,7 @@ class BaseImage(Resource):
             self.raise_exception()
 
     @manipulative
+    @_cancellable
     def distort(self, method, arguments, best_fit=False):
         """Distorts an image using various distorting methods.
 
@@ -2743,6 +3284,10 @@ class BaseImage(Resource):
                          Defaults False
         :type best_fit: :class:`bool`
 
+        .. versionchanged:: 0.5.3
+           Added ``deadline`` and ``cancel_event`` keyword arguments to
+           abort it midway.  See :meth:`monitor()`.
+
         .. versionadded:: 0.4.1
         """
         if method not in DISTORTION_METHODS:
@@ -2758,6 +3303,40 @@ class BaseImage(Resource):
                                    argc, argv, bool(best_fit))
         self.raise_exception()
 
+    def dominant_colors(self, n=5, colors=None):
+        """Finds the ``n`` most common colors of the image, without
+        turning the whole :attr:`histogram` into a :class:`dict` of
+        :class:`~wand.color.Color` objects.
+
+        True-color photos can have millions of distinct colors, so set
+        ``colors`` to reduce a copy of the image to that many colors with
+        :meth:`quantize()` first, e.g. to extract a palette::
+
+            with Image(filename='photo.jpg') as img:
+                palette = [color for color, count
+                           in img.dominant_colors(5, colors=32)]
+
+        :param n: the number of colors to find
+        :type n: :class:`numbers.Integral`
+        :param colors: the number of colors to quantize to first.
+                       the image is not quantized by default
+        :type colors: :class:`numbers.Integral`
+        :returns: ``(color, count)`` pairs, the most common first
+        :rtype: :class:`list`
+
+        .. versionadded:: 0.5.3
+
+        """
+        if not isinstance(n, numbers.Integral):
+            raise TypeError('n must be an integer, not ' + repr(n))
+        elif n < 1:
+            raise ValueError('n must be a natural number, not ' + repr(n))
+        if colors is None:
+            return self.histogram.most_common(n)
+        with self.clone() as reduced:
+            reduced.quantize(colors, 'undefined', 0, False, False)
+            return reduced.histogram.most_common(n)
+
     @manipulative
     def edge(self, radius=0.0):
         """Applies convolution filter to detect edges.
@@ -2870,11 +3449,71 @@ class BaseImage(Resource):
             library.MagickEvaluateImage(self.wand, idx_op, value)
         self.raise_exception()
 
+    def export_array(self, channel_map=None, storage=None, out=None):
+        """Export all pixels into a contiguous buffer with a
+        ``(height, width, channels)`` layout.  Unlike :meth:`export_pixels()`
+        no Python object is created per value; ImageMagick writes directly
+        into the buffer's memory.
+
+        Without ``out`` a new :mod:`ctypes` array is allocated.  It supports
+        the buffer protocol, so NumPy can wrap it without copying::
+
+            with Image(filename='rose:') as img:
+                data = numpy.asarray(img.export_array(storage='float'))
+                assert data.shape == (img.height, img.width, 3)
+
+        Pass a preallocated ``out`` buffer (e.g. a C-contiguous
+        :class:`numpy.ndarray`, :class:`bytearray`, or :class:`array.array`)
+        to reuse the same memory across many exports.  If ``storage`` isn't
+        given, it's guessed from the item type of ``out``::
+
+            frame = numpy.empty((img.height, img.width, 4), numpy.uint16)
+            img.export_array(channel_map='RGBA', out=frame)
+
+        :param channel_map: a string listing the channel data format for
+                            each pixel.  See :meth:`export_pixels()` for valid
+                            labels.  Default is ``'RGBA'`` if the image has an
+                            :attr:`alpha_channel`, or ``'RGB'`` otherwise.
+        :type channel_map: :class:`basestring`
+        :param storage: what data type each value should be calculated as.
+                        See :const:`STORAGE_TYPES`.  Default is ``'char'``,
+                        or the item type of ``out``.
+        :type storage: :class:`basestring`
+        :param out: an optional writable buffer to export pixels into.
+                    It must be at least
+                    ``height * width * len(channel_map)`` values large.
+        :returns: ``out``, or a new :mod:`ctypes` array.
+        :raises TypeError: if ``out`` isn't a writable buffer, or its
+                           storage type can't be guessed.
+        :raises ValueError: if ``out`` is too small.
+
+        .. versionadded:: 0.5.3
+        """
+        width, height = self.size
+        if channel_map is None:
+            channel_map = 'RGBA' if self.alpha_channel else 'RGB'
+        if out is None:
+            if storage is None:
+                storage = 'char'
+            out = _new_pixel_buffer(channel_map, storage, width, height)
+        return self.export_pixels(0, 0, width, height,
+                                  channel_map=channel_map,
+                                  storage=storage, out=out)
+
     def export_pixels(self, x=0, y=0, width=None, height=None,
-                      channel_map="RGBA", storage='char'):
+                      channel_map="RGBA", storage=None, out=None):
         """Export pixel data from a raster image to
         a list of values.
 
+        Building a list creates one Python object per value.  To keep
+        the values in a flat native buffer instead, pass a writable
+        ``out`` buffer (e.g. :class:`bytearray`, :class:`array.array`, or
+        :class:`numpy.ndarray`), and reuse it across calls::
+
+            tile = bytearray(64 * 64 * 3)
+            for left in range(0, img.width, 64):
+                img.export_pixels(left, 0, 64, 64, 'RGB', 'char', out=tile)
+
         The ``channel_map`` tells ImageMagick which color
         channels to export, and what order they should be
         written as -- per pixel. Valid entries for
@@ -2920,18 +3559,29 @@ class BaseImage(Resource):
                             format for each pixel.
         :type channel_map: :class:`basestring`
         :param storage: what data type each value should
-                        be calculated as.
+                        be calculated as.  Default is ``'char'``, or
+                        the item type of ``out``.
         :type storage: :class:`basestring`
-        :returns: list of values.
+        :param out: an optional writable buffer to export pixels into.
+                    It must be at least ``width * height * len(channel_map)``
+                    values large.
+        :returns: list of values, or ``out`` if given.
         :rtype: :class:`collections.abc.Sequence`
+        :raises TypeError: if ``out`` isn't a writable buffer, or its
+                           storage type can't be guessed.
+        :raises ValueError: if ``out`` is too small.
 
         .. versionadded:: 0.5.0
+
+        .. versionchanged:: 0.5.3
+           Added ``out`` parameter.  The ``width`` & ``height`` default to
+           the remaining size of the image after ``x`` & ``y``.
         """
         _w, _h = self.size
         if width is None:
-            width = _w
+            width = _w - x
         if height is None:
-            height = _h
+            height = _h - y
         if not isinstance(x, numbers.Integral):
             raise TypeError('expecting integer, not ' + repr(x))
         if not isinstance(y, numbers.Integral):
@@ -2949,24 +3599,29 @@ class BaseImage(Resource):
             if channel not in valid_channels:
                 raise ValueError('Unknown channel label: ' +
                                  repr(channel))
-        if storage not in STORAGE_TYPES:
+        if storage is None:
+            if out is None:
+                storage = 'char'
+            else:
+                storage = _buffer_storage(out)
+                if storage is None:
+                    raise TypeError('unable to guess storage type of ' +
+                                    repr(out) + '; pass storage explicitly')
+        if storage not in STORAGE_TYPES[1:]:
             raise ValueError('storage must be a value from STORAGE_TYPES, '
                              ' not ' + repr(storage))
-        c_storage_types = [
-            None,
-            ctypes.c_ubyte,
-            ctypes.c_double,
-            ctypes.c_float,
-            ctypes.c_uint,
-            ctypes.c_ulong,
-            ctypes.c_double,  # FIXME: Might be c_longdouble?
-            ctypes.c_ushort
-        ]
         s_index = STORAGE_TYPES.index(storage)
-        c_storage = c_storage_types[s_index]
-        total_pixels = (width - x) * (height - y)
-        c_buffer_size = total_pixels * len(channel_map)
-        c_buffer = (c_buffer_size * c_storage)()
+        c_storage = _STORAGE_CTYPES[s_index]
+        c_buffer_size = width * height * len(channel_map)
+        if out is None:
+            c_buffer = (c_buffer_size * c_storage)()
+        else:
+            nbytes = c_buffer_size * ctypes.sizeof(c_storage)
+            try:
+                c_buffer = (ctypes.c_char * nbytes).from_buffer(out)
+            except TypeError:
+                raise TypeError('out must be a writable buffer, not ' +
+                                repr(out))
         r = library.MagickExportImagePixels(self.wand,
                                             x, y, width, height,
                                             binary(channel_map),
@@ -2974,6 +3629,8 @@ class BaseImage(Resource):
                                             ctypes.byref(c_buffer))
         if not r:
             self.raise_exception()
+        if out is not None:
+            return out
         return c_buffer[:c_buffer_size]
 
     @manipulative
@@ -3010,6 +3667,83 @@ class BaseImage(Resource):
         if not result:
             self.raise_exception()
 
+    def fingerprint(self, algorithm=None, region=None):
+        """Computes a hash of the image content, e.g. to be used as a
+        cache key.  Unlike :attr:`signature`, pixels are hashed as 8-bit
+        RGBA values, so the same image stored at different depths has the
+        same fingerprint::
+
+            with Image(filename='photo.jpg') as img:
+                key = img.fingerprint()
+                corner = img.fingerprint(region=(0, 0, 64, 64))
+
+        The pixels are exported by bands of rows into a single reused
+        buffer, which is fed to the hash function directly.
+
+        :param algorithm: the name of any :mod:`hashlib` algorithm e.g.
+                          ``'sha256'``, or ``'crc32'`` & ``'adler32'``,
+                          which are faster, but too short to tell apart
+                          many images.  default is 128-bit ``'blake2b'``
+                          where it's available, and ``'sha1'`` otherwise
+        :type algorithm: :class:`basestring`
+        :param region: an optional ``(x, y, width, height)`` region to
+                       hash.  default is the whole image
+        :type region: :class:`collections.abc.Sequence`
+        :returns: the hexadecimal digest
+        :rtype: :class:`str`
+        :raises ValueError: when the ``algorithm`` is unknown
+
+        .. versionadded:: 0.5.3
+
+        """
+        if region is None:
+            x, y = 0, 0
+            width, height = self.size
+        else:
+            x, y, width, height = self._region(region)
+        if algorithm is not None and not isinstance(algorithm, string_type):
+            raise TypeError('algorithm must be a string, not ' +
+                            repr(algorithm))
+        header = binary('{0}x{1}:'.format(width, height))
+        if algorithm is None:
+            if hasattr(hashlib, 'blake2b'):
+                hash_ = hashlib.blake2b(digest_size=16)
+            else:
+                hash_ = hashlib.sha1()
+            hash_.update(header)
+            update = hash_.update
+            hexdigest = hash_.hexdigest
+        elif algorithm in ('crc32', 'adler32'):
+            checksum = getattr(zlib, algorithm)
+            digest = [checksum(header)]
+
+            def update(data):
+                digest[0] = checksum(data, digest[0])
+
+            def hexdigest():
+                return '{0:08x}'.format(digest[0] & 0xffffffff)
+        else:
+            try:
+                hash_ = hashlib.new(algorithm)
+            except ValueError:
+                raise ValueError('unknown algorithm: ' + repr(algorithm))
+            hash_.update(header)
+            update = hash_.update
+            hexdigest = hash_.hexdigest
+        row_size = width * 4
+        rows = max(1, min(height, _FINGERPRINT_BAND_SIZE // row_size))
+        band = (ctypes.c_ubyte * (rows * row_size))()
+        for top in xrange(y, y + height, rows):
+            rows = min(rows, y + height - top)
+            if len(band) == rows * row_size:
+                data = band
+            else:
+                data = (ctypes.c_ubyte * (rows * row_size)).from_buffer(band)
+            self.export_pixels(x, top, width, rows, channel_map='RGBA',
+                               storage='char', out=data)
+            update(data)
+        return hexdigest()
+
     @manipulative
     def flip(self):
         """Creates a vertical mirror image by reflecting the pixels around
@@ -3252,6 +3986,61 @@ class BaseImage(Resource):
         if not r:
             self.raise_exception()
 
+    def get_pixels(self, coords):
+        """Reads the colors of the pixels at the given coordinates.  Each
+        pixel is read by a single :c:func:`MagickGetImagePixelColor` call,
+        so no :class:`Iterator` is created and no other pixels of the row
+        are converted to :class:`~wand.color.Color`.
+
+        .. code-block:: python
+
+           with Image(filename='rose.png') as img:
+               top_left, center = img.get_pixels([
+                   (0, 0),
+                   (img.width // 2, img.height // 2)
+               ])
+
+        Negative coordinates count from the right and bottom edges, like
+        ``img[x, y]``.
+
+        :param coords: an iterable of ``(x, y)`` pairs
+        :type coords: :class:`collections.abc.Iterable`
+        :returns: the colors of the pixels, in the order of ``coords``
+        :rtype: :class:`list`
+        :raises IndexError: when a coordinate is out of the image
+
+        .. versionadded:: 0.5.3
+
+        """
+        width, height = self.size
+        colors = []
+        pixel = library.NewPixelWand()
+        try:
+            for x, y in coords:
+                if not (isinstance(x, numbers.Integral) and
+                        isinstance(y, numbers.Integral)):
+                    raise TypeError('x and y must be integral, not ' +
+                                    repr((x, y)))
+                if x < 0:
+                    x += width
+                if y < 0:
+                    y += height
+                if x >= width:
+                    raise IndexError('x must be less than width')
+                elif y >= height:
+                    raise IndexError('y must be less than height')
+                elif x < 0:
+                    raise IndexError('x cannot be less than 0')
+                elif y < 0:
+                    raise IndexError('y cannot be less than 0')
+                r = library.MagickGetImagePixelColor(self.wand, x, y, pixel)
+                if not r:
+                    self.raise_exception()
+                colors.append(Color.from_pixelwand(pixel))
+        finally:
+            library.DestroyPixelWand(pixel)
+        return colors
+
     @manipulative
     def hald_clut(self, image):
         """Replace color values by referencing a Higher And Lower Dimension
@@ -3274,6 +4063,7 @@ class BaseImage(Resource):
         if not r:
             self.raise_exception()
 
+    @manipulative
     def implode(self, amount=0.0, method="undefined"):
         """Creates a "imploding" effect by pulling pixels towards the center
         of the image.
@@ -3299,12 +4089,22 @@ class BaseImage(Resource):
         if not r:
             self.raise_exception()
 
+    @manipulative
     def import_pixels(self, x=0, y=0, width=None, height=None,
-                      channel_map='RGB', storage='char', data=None):
+                      channel_map='RGB', storage=None, data=None):
         """Import pixel data from a byte-string to
         the image. The instance of :class:`Image` must already
         be allocated with the correct size.
 
+        The ``data`` can be a list of values, or any C-contiguous object
+        supporting the buffer protocol (e.g. :class:`bytes`,
+        :class:`bytearray`, :class:`memoryview`, :class:`array.array`, or
+        :class:`numpy.ndarray`).  Buffers are handed to ImageMagick
+        directly, without unpacking each value into a Python object::
+
+            with Image(width=640, height=480) as img:
+                img.import_pixels(channel_map='RGB', data=rgb_bytes)
+
         The ``channel_map`` tells ImageMagick which color
         channels to export, and what order they should be
         written as -- per pixel. Valid entries for
@@ -3350,16 +4150,24 @@ class BaseImage(Resource):
                             format for each pixel.
         :type channel_map: :class:`basestring`
         :param storage: what data type each value should
-                        be calculated as.
+                        be calculated as.  Default is ``'char'``, or
+                        the item type of a ``data`` buffer.
         :type storage: :class:`basestring`
+        :param data: the pixel values.
+        :type data: :class:`collections.abc.Sequence`, buffer object
 
         .. versionadded:: 0.5.0
+
+        .. versionchanged:: 0.5.3
+           The ``data`` parameter accepts objects supporting the buffer
+           protocol, and ``width`` & ``height`` default to the remaining
+           size of the image after ``x`` & ``y``.
         """
         _w, _h = self.size
         if width is None:
-            width = _w
+            width = _w - x
         if height is None:
-            height = _h
+            height = _h - y
         if not isinstance(x, numbers.Integral):
             raise TypeError('expecting integer, not ' + repr(x))
         if not isinstance(y, numbers.Integral):
@@ -3368,7 +4176,21 @@ class BaseImage(Resource):
             raise TypeError('expecting integer, not ' + repr(width))
         if not isinstance(height, numbers.Integral):
             raise TypeError('expecting integer, not ' + repr(height))
-        if storage not in STORAGE_TYPES:
+        try:
+            memoryview(data)
+        except TypeError:
+            is_buffer = hasattr(data, '__array_interface__')
+        else:
+            is_buffer = True
+        if storage is None:
+            storage = 'char'
+            if is_buffer and not isinstance(data, binary_type):
+                storage = _buffer_storage(data)
+                if storage is None:
+                    raise TypeError('unable to guess storage type of ' +
+                                    repr(data) + '; pass storage '
+                                    'explicitly')
+        if storage not in STORAGE_TYPES[1:]:
             raise ValueError('storage must be a value from STORAGE_TYPES, '
                              ' not ' + repr(storage))
         if not isinstance(channel_map, string_type):
@@ -3380,39 +4202,40 @@ class BaseImage(Resource):
             if channel not in valid_channels:
                 raise ValueError('Unknown channel label: ' +
                                  repr(channel))
-        if not isinstance(data, abc.Sequence):
-            raise TypeError('data must list of values, not' +
+        if not (is_buffer or isinstance(data, abc.Sequence)):
+            raise TypeError('data must list of values, or a buffer, not ' +
                             repr(data))
-        # Ensure enough data was given.
-        expected_len = (width - x) * (height - y) * len(channel_map)
-        given_len = len(data)
-        if expected_len != given_len:
-            msg = 'data length should be {0}, not {1}.'.format(
-                expected_len,
-                given_len
-            )
-            raise ValueError(msg)
-        c_storage_types = [
-            None,
-            ctypes.c_ubyte,
-            ctypes.c_double,
-            ctypes.c_float,
-            ctypes.c_uint,
-            ctypes.c_ulong,
-            ctypes.c_double,  # FIXME: Might be c_longdouble ?
-            ctypes.c_ushort
-        ]
         s_index = STORAGE_TYPES.index(storage)
-        c_type = c_storage_types[s_index]
-        c_buffer = (len(data) * c_type)(*data)
+        c_type = _STORAGE_CTYPES[s_index]
+        # Ensure enough data was given.
+        expected_len = width * height * len(channel_map)
+        if is_buffer:
+            c_buffer, given_bytes = _readable_buffer(data)
+            expected_bytes = expected_len * ctypes.sizeof(c_type)
+            if expected_bytes != given_bytes:
+                msg = 'data size should be {0} bytes, not {1}.'.format(
+                    expected_bytes,
+                    given_bytes
+                )
+                raise ValueError(msg)
+        else:
+            given_len = len(data)
+            if expected_len != given_len:
+                msg = 'data length should be {0}, not {1}.'.format(
+                    expected_len,
+                    given_len
+                )
+                raise ValueError(msg)
+            c_buffer = ctypes.byref((len(data) * c_type)(*data))
         r = library.MagickImportImagePixels(self.wand,
                                             x, y, width, height,
                                             binary(channel_map),
                                             s_index,
-                                            ctypes.byref(c_buffer))
+                                            c_buffer)
         if not r:
             self.raise_exception()
 
+    @manipulative
     def level(self, black=0.0, white=None, gamma=1.0, channel=None):
         """Adjusts the levels of an image by scaling the colors falling
         between specified black and white points to the full available
@@ -3503,6 +4326,7 @@ class BaseImage(Resource):
                                          linear_range * white_point)
 
     @manipulative
+    @_cancellable
     def liquid_rescale(self, width, height, delta_x=0, rigidity=0):
         """Rescales the image with `seam carving`_, also known as
         image retargeting, content-aware resizing, or liquid rescaling.
@@ -3532,6 +4356,10 @@ class BaseImage(Resource):
               The article which explains what seam carving is
               on Wikipedia.
 
+        .. versionchanged:: 0.5.3
+           Added ``deadline`` and ``cancel_event`` keyword arguments to
+           abort it midway.  See :meth:`monitor()`.
+
         .. _Seam carving: http://en.wikipedia.org/wiki/Seam_carving
 
         """
@@ -3621,7 +4449,120 @@ class BaseImage(Resource):
         if not r:
             self.raise_exception()
 
+    @contextlib.contextmanager
+    def monitor(self, callback=None, deadline=None, cancel_event=None):
+        """Monitors the progress of operations within a :keyword:`with`
+        block, and aborts them when the ``deadline`` passes, the
+        ``cancel_event`` is set, or the ``callback`` returns :const:`False`.
+        It can stop runaway operations on untrusted images midway::
+
+            with img.monitor(deadline=time.time() + 2):
+                img.liquid_rescale(img.width // 2, img.height)
+
+        An aborted operation raises :exc:`~wand.exceptions.WandAbortedError`,
+        or at the latest the block does when it ends.  Since the monitor
+        is also installed on the wand, it covers :meth:`Image.read()` as
+        well.  Resizing, distorting, liquid rescaling, morphology and
+        reading also take ``deadline`` and ``cancel_event`` arguments,
+        which are shortcuts for this.  Blocks can be nested, and the outer
+        ones stay in effect within the inner ones.
+
+        :param callback: the function called with the tag of the task
+                         e.g. ``'Resize/Image'``, the current offset, and
+                         the span of the task.  the task is aborted if it
+                         returns :const:`False`.  note that it may be
+                         called from ImageMagick's own threads
+        :type callback: :class:`collections.abc.Callable`
+        :param deadline: the :func:`time.time()` to abort operations at
+        :type deadline: :class:`numbers.Real`
+        :param cancel_event: the event to abort operations when it's set
+        :type cancel_event: :class:`threading.Event`
+        :raises wand.exceptions.WandAbortedError: when an operation is
+                                                  aborted
+
+        .. versionadded:: 0.5.3
+
+        """
+        if callback is not None and not callable(callback):
+            raise TypeError('callback must be callable, not ' +
+                            repr(callback))
+        if deadline is not None and not isinstance(deadline, numbers.Real):
+            raise TypeError('deadline must be a time.time() value, not ' +
+                            repr(deadline))
+        aborted = []
+        # Blocks can be nested, e.g. by a deadline argument of an operation
+        # within a monitored block; the outer monitor stays in effect, and
+        # is reinstalled at the end.
+        outer_key = self._progress_monitor_key
+
+        def monitor(tag, offset, span):
+            if aborted:
+                return False
+            try:
+                if outer_key is not None and \
+                        not _dispatch_progress(tag, offset, span, outer_key):
+                    aborted.append('aborted by the outer monitor')
+                elif cancel_event is not None and cancel_event.is_set():
+                    aborted.append('cancelled')
+                elif deadline is not None and time.time() > deadline:
+                    aborted.append('deadline has passed')
+                elif callback is not None and \
+                        callback(text(tag), offset, span) is False:
+                    aborted.append('aborted by the callback')
+            except Exception as e:
+                aborted.append(e)
+            return not aborted
+
+        key = next(_progress_monitor_keys)
+        _progress_monitors[key] = monitor
+        self._set_progress_monitor(_c_progress_monitor, key)
+        self._progress_monitor_key = key
+        try:
+            yield
+        except Exception:
+            if not aborted:
+                raise
+        finally:
+            self._progress_monitor_key = outer_key
+            if outer_key is None:
+                self._set_progress_monitor(None, None)
+            else:
+                self._set_progress_monitor(_c_progress_monitor, outer_key)
+            del _progress_monitors[key]
+        if aborted:
+            if isinstance(aborted[0], Exception):
+                raise aborted[0]
+            raise WandAbortedError(aborted[0])
+
+    def _set_progress_monitor(self, c_monitor, key):
+        """Installs the progress monitor on the wand, and on every image in
+        it.
+
+        :param c_monitor: the C callback, or :const:`None` to uninstall
+        :type c_monitor: :class:`ctypes.CFUNCTYPE`
+        :param key: the client data to pass to the callback
+        :type key: :class:`numbers.Integral`
+
+        .. versionadded:: 0.5.3
+
+        """
+        if c_monitor is None:
+            c_monitor = MagickProgressMonitor()  # NULL function pointer
+        client_data = None if key is None else ctypes.c_void_p(key)
+        library.MagickSetProgressMonitor(self.wand, c_monitor, client_data)
+        if not library.MagickGetNumberImages(self.wand):
+            return
+        index = library.MagickGetIteratorIndex(self.wand)
+        try:
+            for i in xrange(library.MagickGetNumberImages(self.wand)):
+                library.MagickSetIteratorIndex(self.wand, i)
+                library.MagickSetImageProgressMonitor(self.wand, c_monitor,
+                                                      client_data)
+        finally:
+            library.MagickSetIteratorIndex(self.wand, index)
+
     @manipulative
+    @_cancellable
     def morphology(self, method=None, kernel=None, iterations=1):
         """Manipulate pixels based on the shape of neighboring pixels.
 
@@ -3673,6 +4614,10 @@ class BaseImage(Resource):
                            by the method operator.
         :type iterations: :class:`numbers.Integral`
 
+        .. versionchanged:: 0.5.3
+           Added ``deadline`` and ``cancel_event`` keyword arguments to
+           abort it midway.  See :meth:`monitor()`.
+
         .. versionadded:: 0.5.0
         """
         if not isinstance(method, string_type):
@@ -3759,6 +4704,7 @@ class BaseImage(Resource):
         if not r:
             self.raise_exception()
 
+    @manipulative
     def negate(self, grayscale=False, channel=None):
         """Negate the colors in the reference image.
 
@@ -3964,6 +4910,192 @@ class BaseImage(Resource):
         if not r:
             self.raise_exception()
 
+    def regions(self, boxes, channel_map=None, storage='char'):
+        """Exports the pixels of many regions at once, straight from the
+        pixel cache, without creating an image for each region.
+        It's the cheapest way to feed many crops of a large image into
+        e.g. :mod:`numpy`::
+
+            for box, pixels in zip(boxes, img.regions(boxes, 'RGB')):
+                x, y, width, height = box
+                array = numpy.frombuffer(pixels, dtype=numpy.uint8)
+                array = array.reshape((height, width, 3))
+
+        :param boxes: ``(x, y, width, height)`` regions to export
+        :type boxes: :class:`collections.abc.Iterable`
+        :param channel_map: a string listing the channel data format for
+                            each pixel.  defaults to ``'RGBA'`` if the image
+                            has an alpha channel, and ``'RGB'`` otherwise
+        :type channel_map: :class:`basestring`
+        :param storage: one of :const:`STORAGE_TYPES`.  default is
+                        ``'char'``
+        :type storage: :class:`basestring`
+        :returns: a :mod:`ctypes` array shaped
+                  ``(height, width, len(channel_map))`` for every region,
+                  in the same order
+        :rtype: :class:`list`
+        :raises TypeError: when a box isn't four integers
+        :raises ValueError: when a box is out of the image
+
+        .. versionadded:: 0.5.3
+
+        """
+        boxes = [self._region(box) for box in boxes]
+        if channel_map is None:
+            channel_map = 'RGBA' if self.alpha_channel else 'RGB'
+        arrays = []
+        for x, y, width, height in boxes:
+            out = _new_pixel_buffer(channel_map, storage, width, height)
+            arrays.append(self.export_pixels(x, y, width, height,
+                                             channel_map, storage, out=out))
+        return arrays
+
+    def renditions(self, specs, filter='undefined', blur=1, workers=None):
+        """Makes many resized renditions of the image from a single decode,
+        e.g. icons for every screen density.  Each rendition is resized
+        from the smallest rendition (or the original) that's still at
+        least twice as large, rather than always from the original, and
+        then all renditions are encoded concurrently::
+
+            with Image(filename='res/drawable-xhdpi/icon.png') as img:
+                width, height = img.size
+                img.renditions([
+                    {'width': int(width * ratio),
+                     'filename': 'res/drawable-{0}dpi/icon.png'.format(dpi)}
+                    for dpi, ratio in [('h', .75), ('m', .5), ('l', .375)]
+                ])
+
+        Every spec is a mapping of the following keys.  At least one of
+        ``width`` and ``height`` is required.  If only one is given, the
+        other one keeps the aspect ratio.
+
+        ``width`` (:class:`numbers.Integral`)
+           the width of the rendition
+        ``height`` (:class:`numbers.Integral`)
+           the height of the rendition
+        ``format`` (:class:`basestring`)
+           the format to encode to.  default is the image :attr:`format`
+        ``quality`` (:class:`numbers.Integral`)
+           the :attr:`compression_quality` to encode with
+        ``filename`` (:class:`basestring`)
+           the file to write to.  the rendition is returned as a blob
+           if it's omitted
+
+        :param specs: the renditions to make
+        :type specs: :class:`collections.abc.Iterable`
+        :param filter: a filter type to use for resizing. choose one in
+                       :const:`FILTER_TYPES`. default is ``'undefined'``
+        :type filter: :class:`basestring`, :class:`numbers.Integral`
+        :param blur: the blur factor where > 1 is blurry, < 1 is sharp.
+                     default is 1
+        :type blur: :class:`numbers.Real`
+        :param workers: the number of threads to encode with.
+                        default is the number of CPUs
+        :type workers: :class:`numbers.Integral`
+        :returns: the blob of every rendition in the same order as
+                  ``specs``, or :const:`None` for the renditions written
+                  to a ``filename``
+        :rtype: :class:`list`
+        :raises TypeError: when a spec isn't a mapping, or has a value
+                           of a wrong type
+        :raises ValueError: when a spec has an unknown key, or lacks
+                            both ``width`` and ``height``
+
+        .. versionadded:: 0.5.3
+
+        """
+        specs = [self._rendition_spec(spec) for spec in specs]
+        workers = _thread_count(workers)
+        # Largest first, so that smaller renditions can be resized from
+        # the larger ones already made.
+        order = sorted(xrange(len(specs)), reverse=True,
+                       key=lambda i: specs[i]['width'] * specs[i]['height'])
+        images = [None] * len(specs)
+        try:
+            for n, i in enumerate(order):
+                spec = specs[i]
+                source = self
+                for j in order[:n]:
+                    larger = images[j]
+                    if (larger.width >= spec['width'] * _RENDITION_MIN_RATIO
+                            and larger.height >= (spec['height'] *
+                                                  _RENDITION_MIN_RATIO)):
+                        source = larger
+                images[i] = source.clone()
+                images[i].resize(spec['width'], spec['height'], filter, blur)
+            # Formats & qualities are set after resizing, because later
+            # renditions are cloned from earlier ones.
+            for image, spec in zip(images, specs):
+                if spec.get('format') is not None:
+                    image.format = spec['format']
+                if spec.get('quality') is not None:
+                    image.compression_quality = spec['quality']
+
+            def encode(i):
+                if specs[i].get('filename') is None:
+                    return images[i].make_blob()
+                images[i].save(filename=specs[i]['filename'])
+
+            # Every rendition has its own wand, so they can be encoded
+            # concurrently.
+            return _map_in_threads(encode, range(len(specs)), workers)
+        finally:
+            for image in images:
+                if image is not None:
+                    image.close()
+
+    def _rendition_spec(self, spec):
+        """Validates a spec of :meth:`renditions()`, and fills in its
+        omitted ``width`` or ``height``.
+
+        :param spec: the spec to validate
+        :type spec: :class:`collections.abc.Mapping`
+        :returns: the spec, with both ``width`` and ``height``
+        :rtype: :class:`dict`
+
+        .. versionadded:: 0.5.3
+
+        """
+        if not isinstance(spec, abc.Mapping):
+            raise TypeError('spec must be a mapping, not ' + repr(spec))
+        unknown = set(spec) - _RENDITION_KEYS
+        if unknown:
+            raise ValueError('unknown keys in spec: ' +
+                             ', '.join(sorted(map(repr, unknown))))
+        spec = dict(spec)
+        width = spec.get('width')
+        height = spec.get('height')
+        for value in width, height:
+            if value is None:
+                continue
+            elif not isinstance(value, numbers.Integral):
+                raise TypeError('width & height must be natural numbers, '
+                                'not ' + repr(value))
+            elif value < 1:
+                raise ValueError('width & height must be natural numbers, '
+                                 'not ' + repr(value))
+        if width is None and height is None:
+            raise ValueError('spec needs width or height: ' + repr(spec))
+        elif width is None:
+            spec['width'] = max(1, int(round(self.width * height /
+                                             float(self.height))))
+        elif height is None:
+            spec['height'] = max(1, int(round(self.height * width /
+                                              float(self.width))))
+        fmt = spec.get('format')
+        if fmt is not None and not isinstance(fmt, string_type):
+            raise TypeError("format must be a string like 'png' or 'jpeg'"
+                            ', not ' + repr(fmt))
+        quality = spec.get('quality')
+        if quality is not None and not isinstance(quality, numbers.Integral):
+            raise TypeError('quality must be an integer, not ' +
+                            repr(quality))
+        filename = spec.get('filename')
+        if filename is not None and not isinstance(filename, string_type):
+            raise TypeError('filename must be a string, not ' +
+                            repr(filename))
+        return spec
+
     @manipulative
     def resample(self, x_res=None, y_res=None, filter='undefined', blur=1):
         """Adjust the number of pixels in an image so that when displayed at
@@ -4043,6 +5175,7 @@ class BaseImage(Resource):
         library.MagickResetImagePage(self.wand, None)
 
     @manipulative
+    @_cancellable
     def resize(self, width=None, height=None, filter='undefined', blur=1):
         """Resizes the image.
 
@@ -4060,6 +5193,10 @@ class BaseImage(Resource):
                      default is 1
         :type blur: :class:`numbers.Real`
 
+        .. versionchanged:: 0.5.3
+           Added ``deadline`` and ``cancel_event`` keyword arguments to
+           abort it midway.  See :meth:`monitor()`.
+
         .. versionchanged:: 0.2.1
            The default value of ``filter`` has changed from ``'triangle'``
            to ``'undefined'`` instead.
@@ -4172,6 +5309,151 @@ class BaseImage(Resource):
                 if reset_coords:
                     self.reset_coords()
 
+    @manipulative
+    def set_pixels(self, coords, colors, channel_map=None, storage=None):
+        """Writes the colors of many pixels at once.  Coordinates are
+        grouped by row, and each span of horizontally adjacent pixels is
+        written by a single :c:func:`MagickImportImagePixels` call.
+
+        The ``colors`` can be a single color to fill every coordinate with,
+        a sequence of colors, one for each coordinate, or an object
+        supporting the buffer protocol (e.g. :class:`bytes` or
+        :class:`numpy.ndarray`) containing the ``channel_map`` values of
+        each pixel in the order of ``coords``:
+
+        .. code-block:: python
+
+           with Image(filename='rose.png') as img:
+               img.set_pixels([(0, 0), (1, 0), (0, 1)], 'red')
+               img.set_pixels([(2, 2), (3, 2)],
+                              b'\\xff\\x00\\x00\\x00\\xff\\x00',
+                              channel_map='RGB', storage='char')
+
+        Negative coordinates count from the right and bottom edges.  If
+        a coordinate is given more than once, the last color wins.
+
+        :param coords: an iterable of ``(x, y)`` pairs
+        :type coords: :class:`collections.abc.Iterable`
+        :param colors: a color, colors for each coordinate, or pixel data
+        :type colors: :class:`~wand.color.Color`, :class:`basestring`,
+                      :class:`collections.abc.Sequence`, buffer object
+        :param channel_map: a string listing the channel data format for
+                            each pixel.  See :meth:`import_pixels()`.
+                            Defaults to the channels of the image
+                            colorspace, e.g. ``'RGB'`` or ``'RGBA'``
+        :type channel_map: :class:`basestring`
+        :param storage: the data type of buffer ``colors``.  See
+                        :const:`STORAGE_TYPES`.  Default is ``'char'``, or
+                        the item type of the buffer.  Ignored for colors
+        :type storage: :class:`basestring`
+        :raises IndexError: when a coordinate is out of the image
+
+        .. versionadded:: 0.5.3
+
+        """
+        width, height = self.size
+        points = []
+        for x, y in coords:
+            if not (isinstance(x, numbers.Integral) and
+                    isinstance(y, numbers.Integral)):
+                raise TypeError('x and y must be integral, not ' +
+                                repr((x, y)))
+            if x < 0:
+                x += width
+            if y < 0:
+                y += height
+            if not (0 <= x < width and 0 <= y < height):
+                raise IndexError('{0!r} is out of the image'.format((x, y)))
+            points.append((y, x))
+        if channel_map is None:
+            colorspace = self.colorspace
+            if colorspace == 'gray':
+                channel_map = 'I'
+            else:
+                channel_map = 'CMYK' if colorspace == 'cmyk' else 'RGB'
+                if self.alpha_channel:
+                    channel_map += 'A'
+        elif not isinstance(channel_map, string_type):
+            raise TypeError('channel_map must be a string, not ' +
+                            repr(channel_map))
+        fill = isinstance(colors, (string_type, Color))
+        try:
+            memoryview(colors)
+        except TypeError:
+            is_buffer = hasattr(colors, '__array_interface__')
+        else:
+            is_buffer = not fill
+        if is_buffer:
+            if storage is None:
+                storage = 'char'
+                if not isinstance(colors, binary_type):
+                    storage = _buffer_storage(colors)
+                    if storage is None:
+                        raise TypeError('unable to guess storage type of ' +
+                                        repr(colors) + '; pass storage '
+                                        'explicitly')
+            if storage not in STORAGE_TYPES[1:]:
+                raise ValueError('storage must be a value from '
+                                 'STORAGE_TYPES, not ' + repr(storage))
+            c_type = _STORAGE_CTYPES[STORAGE_TYPES.index(storage)]
+            pixel_size = ctypes.sizeof(c_type) * len(channel_map)
+            c_buffer, nbytes = _readable_buffer(colors)
+            if nbytes != pixel_size * len(points):
+                raise ValueError('colors size should be {0} bytes, '
+                                 'not {1}.'.format(pixel_size * len(points),
+                                                   nbytes))
+            data = ctypes.string_at(c_buffer, nbytes)
+        else:
+            storage = 'double'
+            if fill:
+                colors = [colors]
+            else:
+                colors = list(colors)
+                if len(colors) != len(points):
+                    raise ValueError('expected {0} colors, not {1}'.format(
+                        len(points), len(colors)
+                    ))
+            getters = []
+            for channel in channel_map:
+                try:
+                    getters.append(_CHANNEL_GETTERS[channel.upper()])
+                except KeyError:
+                    raise ValueError('unknown channel: ' + repr(channel))
+            values = []
+            for color in colors:
+                if isinstance(color, string_type):
+                    color = Color(color)
+                elif not isinstance(color, Color):
+                    raise TypeError('color must be an instance of Color, '
+                                    'not ' + repr(color))
+                values.extend(getter(color) for getter in getters)
+            pixel_size = ctypes.sizeof(ctypes.c_double) * len(channel_map)
+            c_buffer = (ctypes.c_double * len(values))(*values)
+            data = ctypes.string_at(c_buffer, ctypes.sizeof(c_buffer))
+        s_index = STORAGE_TYPES.index(storage)
+        channel_map = binary(channel_map)
+        # Sort by row then column, keeping the given order of duplicates,
+        # to import each horizontal span of pixels at once.
+        order = sorted(xrange(len(points)), key=points.__getitem__)
+        start = 0
+        while start < len(order):
+            y, x = points[order[start]]
+            end = start + 1
+            while (end < len(order) and
+                   points[order[end]] == (y, x + end - start)):
+                end += 1
+            if fill:
+                span = data * (end - start)
+            else:
+                span = b''.join(data[i * pixel_size:(i + 1) * pixel_size]
+                                for i in order[start:end])
+            r = library.MagickImportImagePixels(self.wand, x, y,
+                                                end - start, 1,
+                                                channel_map, s_index, span)
+            if not r:
+                self.raise_exception()
+            start = end
+
     @manipulative
     def shade(self, gray=False, azimuth=0.0, elevation=0.0):
         """Creates a 3D effect by simulating a light from an
@@ -4280,6 +5562,7 @@ class BaseImage(Resource):
         if not r:
             self.raise_exception()
 
+    @manipulative
     def strip(self):
         """Strips an image of all profiles and comments.
 
@@ -4372,6 +5655,86 @@ class BaseImage(Resource):
         if not r:
             self.raise_exception()
 
+    @manipulative
+    def thumbnail(self, width=None, height=None):
+        """Changes the size of the image for a thumbnail, using
+        :c:func:`MagickThumbnailImage`.  It's much faster than
+        :meth:`resize()` on large images, as it samples the image down
+        before resizing, and strips all profiles & comments except color
+        profiles.
+
+        The ``width`` can also be a geometry string, like the ``resize``
+        parameter of :meth:`transform()`::
+
+            with Image(filename='large.jpg') as img:
+                img.thumbnail('256x256>')
+
+        :param width: the width of the thumbnail, or a geometry string.
+                      default is the original width
+        :type width: :class:`numbers.Integral`, :class:`basestring`
+        :param height: the height of the thumbnail.
+                       default is the original height
+        :type height: :class:`numbers.Integral`
+
+        .. seealso::
+
+           :meth:`Image.read()`'s ``size_hint`` parameter,
+           to decode large JPEG images at a reduced size beforehand.
+
+        .. versionadded:: 0.5.3
+
+        """
+        if isinstance(width, string_type):
+            if height is not None:
+                raise TypeError('height cannot be given with a geometry '
+                                'string')
+            try:
+                geometry = width.encode('ascii')
+            except UnicodeEncodeError:
+                raise ValueError('geometry must only contain '
+                                 'ascii-encodable characters.')
+            x = ctypes.c_ssize_t()
+            y = ctypes.c_ssize_t()
+            width = ctypes.c_size_t(self.width)
+            height = ctypes.c_size_t(self.height)
+            libmagick.ParseMetaGeometry(geometry,
+                                        ctypes.byref(x),
+                                        ctypes.byref(y),
+                                        ctypes.byref(width),
+                                        ctypes.byref(height))
+            width = width.value
+            height = height.value
+        if width is None:
+            width = self.width
+        if height is None:
+            height = self.height
+        if not isinstance(width, numbers.Integral):
+            raise TypeError('width must be a natural number, not ' +
+                            repr(width))
+        elif not isinstance(height, numbers.Integral):
+            raise TypeError('height must be a natural number, not ' +
+                            repr(height))
+        elif width < 1:
+            raise ValueError('width must be a natural number, not ' +
+                             repr(width))
+        elif height < 1:
+            raise ValueError('height must be a natural number, not ' +
+                             repr(height))
+        if self.animation:
+            self.wand = library.MagickCoalesceImages(self.wand)
+            library.MagickSetLastIterator(self.wand)
+            n = library.MagickGetIteratorIndex(self.wand)
+            library.MagickResetIterator(self.wand)
+            for i in xrange(n + 1):
+                library.MagickSetIteratorIndex(self.wand, i)
+                library.MagickThumbnailImage(self.wand, width, height)
+            library.MagickSetSize(self.wand, width, height)
+        else:
+            r = library.MagickThumbnailImage(self.wand, width, height)
+            library.MagickSetSize(self.wand, width, height)
+            if not r:
+                self.raise_exception()
+
     @manipulative
     def transform(self, crop='', resize=''):
         """Transforms the image using :c:func:`MagickTransformImage`,
@@ -4935,30 +6298,29 @@ class Image(BaseImage):
     #: internal operations.
     #:
     #: .. versionadded:: 0.5.0
-    artifacts = None
+    artifacts = _LazyHelper('artifacts', lambda image: ArtifactTree(image))
 
-    #: (:class:`ChannelImageDict`) The mapping of separated channels
-    #: from the image. ::
+    #: (:class:`Metadata`) The metadata mapping of the image.  Read only.
     #:
-    #:     with image.channel_images['red'] as red_image:
-    #:         display(red_image)
-    channel_images = None
+    #: .. versionadded:: 0.3.0
+    metadata = _LazyHelper('metadata', lambda image: Metadata(image))
 
-    #: (:class:`ChannelDepthDict`) The mapping of channels to their depth.
-    #: Read only.
+    #: (:class:`ProfileDict`) The mapping of image profiles.
     #:
-    #: .. versionadded:: 0.3.0
-    channel_depths = None
+    #: .. versionadded:: 0.5.1
+    profiles = _LazyHelper('profiles', lambda image: ProfileDict(image))
 
-    #: (:class:`Metadata`) The metadata mapping of the image.  Read only.
+    #: (:class:`~wand.sequence.Sequence`) The list of
+    #: :class:`~wand.sequence.SingleImage`\ s that the image contains.
     #:
     #: .. versionadded:: 0.3.0
-    metadata = None
+    sequence = _LazyHelper('sequence', lambda image: _sequence(image))
 
-    #: (:class:`ProfileDict`) The mapping of image profiles.
+    #: (:class:`ctypes.CFUNCTYPE`) The :mod:`ctypes` function that makes
+    #: a new wand.  :class:`ImagePool` replaces it to recycle wands.
     #:
-    #: .. versionadded:: 0.5.1
-    profiles = None
+    #: .. versionadded:: 0.5.3
+    c_new_resource = library.NewMagickWand
 
     def __init__(self, image=None, blob=None, file=None, filename=None,
                  format=None, width=None, height=None, depth=None,
@@ -4982,7 +6344,7 @@ class Image(BaseImage):
             raise ValueError('Depth must be 8, 16 or 32')
         with self.allocate():
             if image is None:
-                wand = library.NewMagickWand()
+                wand = self.c_new_resource()
                 super(Image, self).__init__(wand)
             if image is not None:
                 if not isinstance(image, BaseImage):
@@ -5035,11 +6397,6 @@ class Image(BaseImage):
                     r = library.MagickSetImageDepth(self.wand, depth)
                     if not r:
                         raise self.raise_exception()
-            self.metadata = Metadata(self)
-            self.artifacts = ArtifactTree(self)
-            from .sequence import Sequence
-            self.sequence = Sequence(self)
-            self.profiles = ProfileDict(self)
         self.raise_exception()
 
     def __repr__(self):
@@ -5070,6 +6427,7 @@ class Image(BaseImage):
         mimetype = rp.value
         return text(mimetype)
 
+    @manipulative
     def blank(self, width, height, background=None):
         """Creates blank image.
 
@@ -5106,6 +6464,7 @@ class Image(BaseImage):
                 self.raise_exception()
         return self
 
+    @manipulative
     def clear(self):
         """Clears resources associated with the image, leaving the image blank,
         and ready to be used with new image.
@@ -5194,10 +6553,153 @@ class Image(BaseImage):
         manager.
 
         """
-        while self.sequence:
-            self.sequence.pop()
+        # There are no single images to remove if the sequence has never
+        # been accessed.
+        sequence = self.__dict__.get('sequence')
+        while sequence:
+            sequence.pop()
         super(Image, self).destroy()
 
+    @classmethod
+    def from_array(cls, array, channel_map=None, storage=None):
+        """Creates a new image from a ``(height, width)`` or
+        ``(height, width, channels)`` shaped buffer, e.g. a NumPy array,
+        a multi-dimensional :class:`memoryview`, or the result of
+        :meth:`~BaseImage.export_array()`.  The pixel memory is handed to
+        :c:func:`MagickConstituteImage` directly. ::
+
+            with Image.from_array(numpy.zeros((480, 640, 3), 'uint8')) as img:
+                assert img.size == (640, 480)
+
+        :param array: a C-contiguous object supporting the buffer protocol.
+        :param channel_map: a string listing the channel data format for
+                            each pixel.  By default it's guessed from the
+                            number of channels: ``'I'``, ``'IA'``, ``'RGB'``,
+                            or ``'RGBA'``.
+        :type channel_map: :class:`basestring`
+        :param storage: what data type each value is stored as.  See
+                        :const:`STORAGE_TYPES`.  By default it's guessed
+                        from the item type of ``array``.
+        :type storage: :class:`basestring`
+        :returns: a new image
+        :rtype: :class:`Image`
+        :raises TypeError: if ``array`` doesn't support the buffer protocol,
+                           or its storage type can't be guessed.
+        :raises ValueError: if the shape of ``array`` doesn't match
+                            ``channel_map`` & ``storage``.
+
+        .. versionadded:: 0.5.3
+        """
+        shape = _buffer_shape(array)
+        if len(shape) == 2:
+            height, width = shape
+            channels = 1
+        elif len(shape) == 3:
+            height, width, channels = shape
+        else:
+            raise ValueError('array must have (height, width) or (height, '
+                             'width, channels) shape, not ' + repr(shape))
+        if channel_map is None:
+            if not 1 <= channels <= 4:
+                raise ValueError('unable to guess channel_map for {0} '
+                                 'channels'.format(channels))
+            channel_map = ('I', 'IA', 'RGB', 'RGBA')[channels - 1]
+        if not isinstance(channel_map, string_type):
+            raise TypeError('channel_map must be a string, not ' +
+                            repr(channel_map))
+        channel_map = channel_map.upper()
+        valid_channels = 'RGBAOCYMKIP'
+        for channel in channel_map:
+            if channel not in valid_channels:
+                raise ValueError('Unknown channel label: ' +
+                                 repr(channel))
+        if storage is None:
+            storage = _buffer_storage(array)
+            if storage is None:
+                raise TypeError('unable to guess storage type of ' +
+                                repr(array) + '; pass storage explicitly')
+        if storage not in STORAGE_TYPES[1:]:
+            raise ValueError('storage must be a value from STORAGE_TYPES, '
+                             ' not ' + repr(storage))
+        s_index = STORAGE_TYPES.index(storage)
+        c_buffer, given_bytes = _readable_buffer(array)
+        expected_bytes = (width * height * len(channel_map) *
+                          ctypes.sizeof(_STORAGE_CTYPES[s_index]))
+        if expected_bytes != given_bytes:
+            msg = 'array size should be {0} bytes, not {1}.'.format(
+                expected_bytes,
+                given_bytes
+            )
+            raise ValueError(msg)
+        image = cls()
+        r = library.MagickConstituteImage(image.wand, width, height,
+                                          binary(channel_map), s_index,
+                                          c_buffer)
+        if not r:
+            try:
+                image.raise_exception()
+            except WandException:
+                image.close()
+                raise
+        return image
+
+    @classmethod
+    def ping(cls, file=None, filename=None, blob=None, resolution=None,
+             format=None):
+        """Reads only the attributes of an image, e.g. its size, format,
+        page, resolution and metadata, without decoding its pixels.
+        It's much faster than opening the image when only its header
+        is needed::
+
+            with Image.ping(filename='upload.jpg') as img:
+                if img.format != 'JPEG' or img.width > 4096:
+                    raise ValueError('unexpected image')
+
+        The returned image has no pixels, so it shouldn't be manipulated,
+        nor saved.  Parameters are the same as those of :class:`Image`.
+
+        :param file: pings an image of the ``file`` object
+        :type file: file object
+        :param filename: pings an image of the ``filename`` string
+        :type filename: :class:`basestring`
+        :param blob: pings an image of the ``blob`` byte array
+        :type blob: :class:`bytes`
+        :param resolution: set a resolution value (dpi),
+                           useful for vectorial formats (like pdf)
+        :type resolution: :class:`collections.abc.Sequence`,
+                          :class:`numbers.Integral`
+        :param format: helps ImageMagick detect the format of ``blob``
+                       or ``file``
+        :type format: :class:`basestring`
+        :returns: an image without pixels
+        :rtype: :class:`Image`
+
+        .. versionadded:: 0.5.3
+
+        """
+        if sum(a is not None for a in (file, filename, blob)) != 1:
+            raise TypeError('expected only one of file, filename or blob '
+                            'parameters')
+        if format is not None and not isinstance(format, string_type):
+            raise TypeError('format must be a string, not ' + repr(format))
+        image = cls()
+        try:
+            if format:
+                format = binary(format)
+                library.MagickSetFormat(image.wand, format)
+                if not filename:
+                    library.MagickSetFilename(image.wand,
+                                              b'buffer.' + format)
+            image.read(file=file, filename=filename, blob=blob,
+                       resolution=resolution, ping=True)
+            # Same as Image(), clear the wand format so that it doesn't
+            # override the format of the image.
+            library.MagickSetFormat(image.wand, binary(''))
+        except:  # noqa: E722
+            image.close()
+            raise
+        return image
+
     def make_blob(self, format=None):
         """Makes the binary string of the image.
 
@@ -5219,8 +6721,29 @@ class Image(BaseImage):
 
         """
         if format is not None:
+            # Encoders may change the image, e.g. GIF reduces its colors,
+            # so it's encoded from a copy, which shares the pixels until
+            # then.
             with self.convert(format) as converted:
                 return converted.make_blob()
+        blob_p, length = self._get_blob()
+        if blob_p:
+            blob = ctypes.string_at(blob_p, length)
+            library.MagickRelinquishMemory(blob_p)
+            return blob
+
+    def _get_blob(self):
+        """Encodes the image, and gets the pointer to the encoded blob
+        without copying it.  The caller must free the blob with
+        :c:func:`MagickRelinquishMemory`.
+
+        :returns: a pair of the blob pointer, and its length in bytes.
+                  the pointer is null if the image couldn't be encoded
+        :rtype: :class:`tuple`
+
+        .. versionadded:: 0.5.3
+
+        """
         library.MagickResetIterator(self.wand)
         length = ctypes.c_size_t()
         blob_p = None
@@ -5231,11 +6754,13 @@ class Image(BaseImage):
             blob_p = library.MagickGetImageBlob(self.wand,
                                                 ctypes.byref(length))
         if blob_p and length.value:
-            blob = ctypes.string_at(blob_p, length.value)
+            return blob_p, length.value
+        if blob_p:
             library.MagickRelinquishMemory(blob_p)
-            return blob
         self.raise_exception()
+        return None, 0
 
+    @manipulative
     def pseudo(self, width, height, pseudo='xc:'):
         """Creates a new image from ImageMagick's internal protocol coders.
 
@@ -5264,7 +6789,10 @@ class Image(BaseImage):
         if not r:
             self.raise_exception()
 
-    def read(self, file=None, filename=None, blob=None, resolution=None):
+    @manipulative
+    @_cancellable
+    def read(self, file=None, filename=None, blob=None, resolution=None,
+             ping=False, size_hint=None):
         """Read new image into Image() object.
 
         :param blob: reads an image from the ``blob`` byte array
@@ -5277,43 +6805,93 @@ class Image(BaseImage):
                            useful for vectorial formats (like PDF)
         :type resolution: :class:`collections.abc.Sequence`,
                           :class:`numbers.Integral`
+        :param ping: only read the image attributes (e.g. size, format and
+                     metadata), without decoding its pixels.  See
+                     :meth:`ping()`
+        :type ping: :class:`bool`
+        :param size_hint: the smallest ``(width, height)`` the image will
+                          be scaled down to afterwards, e.g. by
+                          :meth:`thumbnail()`.  JPEG images are decoded at
+                          a reduced scale no smaller than it, which is much
+                          faster for large images
+        :type size_hint: :class:`collections.abc.Sequence`,
+                         :class:`basestring`
+
+        .. versionchanged:: 0.5.3
+           Added ``ping`` & ``size_hint`` parameters, and ``deadline`` &
+           ``cancel_event`` keyword arguments to abort it midway.  See
+           :meth:`monitor()`.
 
         .. versionadded:: 0.3.0
 
         """
         r = None
-        # Resolution must be set after image reading.
-        if resolution is not None:
-            if (isinstance(resolution, abc.Sequence) and
-                    len(resolution) == 2):
-                library.MagickSetResolution(self.wand, *resolution)
-            elif isinstance(resolution, numbers.Integral):
-                library.MagickSetResolution(self.wand, resolution, resolution)
-            else:
-                raise TypeError('resolution must be a (x, y) pair or an '
-                                'integer of the same x/y')
-        if file is not None:
-            if (isinstance(file, file_types) and
-                    hasattr(libc, 'fdopen') and hasattr(file, 'mode')):
-                fd = libc.fdopen(file.fileno(), file.mode)
-                r = library.MagickReadImageFile(self.wand, fd)
-            elif not callable(getattr(file, 'read', None)):
-                raise TypeError('file must be a readable file object'
-                                ', but the given object does not '
-                                'have read() method')
-            else:
-                blob = file.read()
-                file = None
-        if blob is not None:
-            if not isinstance(blob, abc.Iterable):
-                raise TypeError('blob must be iterable, not ' +
-                                repr(blob))
-            if not isinstance(blob, binary_type):
-                blob = b''.join(blob)
-            r = library.MagickReadImageBlob(self.wand, blob, len(blob))
-        elif filename is not None:
-            filename = encode_filename(filename)
-            r = library.MagickReadImage(self.wand, filename)
+        if size_hint is not None:
+            if (isinstance(size_hint, abc.Sequence) and
+                    not isinstance(size_hint, string_type) and
+                    len(size_hint) == 2):
+                size_hint = '{0}x{1}'.format(*size_hint)
+            elif not isinstance(size_hint, string_type):
+                raise TypeError('size_hint must be a (width, height) pair '
+                                'or a geometry string, not ' +
+                                repr(size_hint))
+            # The JPEG decoder picks the smallest DCT scale that is still
+            # larger than this option.
+            library.MagickSetOption(self.wand, b'jpeg:size',
+                                    binary(size_hint))
+        try:
+            # Resolution must be set after image reading.
+            if resolution is not None:
+                if (isinstance(resolution, abc.Sequence) and
+                        len(resolution) == 2):
+                    library.MagickSetResolution(self.wand, *resolution)
+                elif isinstance(resolution, numbers.Integral):
+                    library.MagickSetResolution(self.wand,
+                                                resolution, resolution)
+                else:
+                    raise TypeError('resolution must be a (x, y) pair or an '
+                                    'integer of the same x/y')
+            if file is not None:
+                if (isinstance(file, file_types) and
+                        hasattr(libc, 'fdopen') and hasattr(file, 'mode')):
+                    fd = libc.fdopen(file.fileno(), binary(file.mode))
+                    if ping:
+                        r = library.MagickPingImageFile(self.wand, fd)
+                    else:
+                        r = library.MagickReadImageFile(self.wand, fd)
+                elif not callable(getattr(file, 'read', None)):
+                    raise TypeError('file must be a readable file object'
+                                    ', but the given object does not '
+                                    'have read() method')
+                elif callable(getattr(file, 'getbuffer', None)):
+                    r = self._read_in_memory(file, ping)
+                    file.seek(0, os.SEEK_END)
+                    file = None
+                else:
+                    blob = _read_at_most(file, _READ_SPOOL_SIZE)
+                    if len(blob) >= _READ_SPOOL_SIZE:
+                        r = self._read_spooled(file, blob, ping)
+                        blob = None
+                    file = None
+            if blob is not None:
+                if not isinstance(blob, abc.Iterable):
+                    raise TypeError('blob must be iterable, not ' +
+                                    repr(blob))
+                if not isinstance(blob, binary_type):
+                    blob = b''.join(blob)
+                if ping:
+                    r = library.MagickPingImageBlob(self.wand, blob, len(blob))
+                else:
+                    r = library.MagickReadImageBlob(self.wand, blob, len(blob))
+            elif filename is not None:
+                filename = encode_filename(filename)
+                if ping:
+                    r = library.MagickPingImage(self.wand, filename)
+                else:
+                    r = library.MagickReadImage(self.wand, filename)
+        finally:
+            if size_hint is not None:
+                library.MagickDeleteOption(self.wand, b'jpeg:size')
         if not r:
             self.raise_exception()
             msg = ('MagickReadImage returns false, but did raise ImageMagick '
@@ -5321,6 +6899,87 @@ class Image(BaseImage):
                    'returns EXIT_SUCCESS without generating a raster.')
             raise WandRuntimeError(msg)
 
+    def _read_in_memory(self, file, ping=False):
+        """Reads the rest of an in-memory stream e.g. :class:`io.BytesIO`,
+        in place if possible.
+
+        :param file: a stream with ``getbuffer()`` method
+        :type file: file object
+        :param ping: only read the image attributes
+        :type ping: :class:`bool`
+        :returns: whether the image was read
+        :rtype: :class:`bool`
+
+        .. versionadded:: 0.5.3
+
+        """
+        whole = file.getbuffer()
+        try:
+            view = whole[file.tell():]
+            try:
+                if _READ_IN_PLACE:
+                    c_buffer, size = _readable_buffer(view)
+                else:
+                    c_buffer = view.tobytes()
+                    size = len(c_buffer)
+                if ping:
+                    r = library.MagickPingImageBlob(self.wand, c_buffer, size)
+                else:
+                    r = library.MagickReadImageBlob(self.wand, c_buffer, size)
+                # The export of the view has to be gone before it's released.
+                del c_buffer
+            finally:
+                view.release()
+        finally:
+            whole.release()
+        return r
+
+    def _read_spooled(self, file, head, ping=False):
+        """Copies ``head`` and the rest of the ``file`` stream in chunks
+        to a temporary file, and reads the image from it, so that large
+        streams never have to be held in memory at once.
+
+        :param file: a readable file object
+        :type file: file object
+        :param head: the data already read from ``file``
+        :type head: :class:`bytes`
+        :param ping: only read the image attributes
+        :type ping: :class:`bool`
+        :returns: whether the image was read
+        :rtype: :class:`bool`
+
+        .. versionadded:: 0.5.3
+
+        """
+        if not (hasattr(libc, 'fdopen') and hasattr(libc, 'fclose')):
+            # Without the C library (e.g. on some Windows runtimes), the
+            # stream is spooled to a named file, and read by its filename.
+            fd, path = tempfile.mkstemp()
+            try:
+                with os.fdopen(fd, 'wb') as spool:
+                    spool.write(head)
+                    shutil.copyfileobj(file, spool, _READ_CHUNK_SIZE)
+                filename = encode_filename(path)
+                if ping:
+                    return library.MagickPingImage(self.wand, filename)
+                return library.MagickReadImage(self.wand, filename)
+            finally:
+                os.remove(path)
+        with tempfile.TemporaryFile() as spool:
+            spool.write(head)
+            shutil.copyfileobj(file, spool, _READ_CHUNK_SIZE)
+            spool.flush()
+            spool.seek(0)
+            fd = libc.fdopen(os.dup(spool.fileno()), b'rb')
+            if not fd:
+                raise OSError('failed to open the spooled stream')
+            try:
+                if ping:
+                    return library.MagickPingImageFile(self.wand, fd)
+                return library.MagickReadImageFile(self.wand, fd)
+            finally:
+                libc.fclose(fd)
+
     def save(self, file=None, filename=None):
         """Saves the image into the ``file`` or ``filename``. It takes
         only one argument at a time.
@@ -5335,6 +6994,11 @@ class Image(BaseImage):
 
         .. versionadded:: 0.1.1
 
+        .. versionchanged:: 0.5.3
+           File objects without :meth:`~io.IOBase.fileno()` are written in
+           chunks, without copying the whole encoded image to a
+           :class:`bytes` first.
+
         """
         if file is None and filename is None:
             raise TypeError('expected an argument')
@@ -5359,7 +7023,18 @@ class Image(BaseImage):
                     raise TypeError('file must be a writable file object, '
                                     'but it does not have write() method: ' +
                                     repr(file))
-                file.write(self.make_blob())
+                blob_p, length = self._get_blob()
+                if blob_p:
+                    # Write the native blob in chunks, so that a copy of
+                    # the whole encoded image is never made.
+                    address = ctypes.addressof(blob_p.contents)
+                    try:
+                        for offset in xrange(0, length, _WRITE_CHUNK_SIZE):
+                            size = min(_WRITE_CHUNK_SIZE, length - offset)
+                            file.write(ctypes.string_at(address + offset,
+                                                        size))
+                    finally:
+                        library.MagickRelinquishMemory(blob_p)
         else:
             if not isinstance(filename, string_type):
                 raise TypeError('filename must be a string, not ' +
@@ -5373,6 +7048,113 @@ class Image(BaseImage):
                 self.raise_exception()
 
 
+class ImagePool(object):
+    """Recycles the wands of closed images for new images, instead of
+    destroying and allocating them every time.  It saves the most for
+    programs that go through many small images, e.g. icons::
+
+        with ImagePool() as pool:
+            for blob in blobs:
+                with pool.image(blob=blob) as img:
+                    img.resize(16, 16)
+                    icons.append(img.make_blob('png'))
+
+    Wands are cleared with :c:func:`ClearMagickWand` before they're
+    reused, so that images made by a pool are just like new ones.  It's
+    thread-safe.
+
+    :param size: the maximum number of idle wands to keep
+    :type size: :class:`numbers.Integral`
+
+    .. versionadded:: 0.5.3
+
+    """
+
+    def __init__(self, size=16):
+        if not isinstance(size, numbers.Integral):
+            raise TypeError('size must be an integer, not ' + repr(size))
+        elif size < 0:
+            raise ValueError('size cannot be less than zero')
+        self.size = size
+        self.wands = []
+        self.lock = threading.Lock()
+        self.closed = False
+        # Idle wands need the MagickWand API as well as images do.
+        increment_refcount()
+
+    def __len__(self):
+        """The number of idle wands."""
+        return len(self.wands)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def __del__(self):
+        if not getattr(self, 'closed', True):
+            self.close()
+
+    def image(self, **kwargs):
+        """Makes an image with a recycled wand if there's an idle one.
+        It takes the same keyword arguments as :class:`Image`, and the
+        wand is returned to the pool when the image is closed.
+
+        :returns: a new image
+        :rtype: :class:`Image`
+
+        """
+        if self.closed:
+            raise RuntimeError('the pool is closed already')
+        image = Image.__new__(Image)
+        image.c_new_resource = self.acquire
+        image.c_destroy_resource = self.release
+        image.__init__(**kwargs)
+        return image
+
+    def acquire(self):
+        """Takes an idle wand, or makes a new one if there's none.
+
+        :returns: a cleared MagickWand pointer
+        :rtype: :class:`ctypes.c_void_p`
+
+        """
+        with self.lock:
+            if self.wands:
+                return self.wands.pop()
+        return library.NewMagickWand()
+
+    def release(self, wand):
+        """Clears the ``wand`` and keeps it for reuse, or destroys it if
+        the pool is full or closed.
+
+        :param wand: a MagickWand pointer
+        :type wand: :class:`ctypes.c_void_p`
+
+        """
+        with self.lock:
+            if not self.closed and len(self.wands) < self.size:
+                library.ClearMagickWand(wand)
+                self.wands.append(wand)
+                return
+        library.DestroyMagickWand(wand)
+
+    def close(self):
+        """Destroys idle wands.  Wands of images that are still open are
+        destroyed when they're closed.
+
+        """
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            wands, self.wands = self.wands, []
+        for wand in wands:
+            library.DestroyMagickWand(wand)
+        decrement_refcount()
+
+
 class Iterator(Resource, abc.Iterator):
     """Row iterator for :class:`Image`. It shouldn't be instantiated
     directly; instead, it can be acquired through :class:`Image` instance::
@@ -5390,11 +7172,23 @@ class Iterator(Resource, abc.Iterator):
     Every row is a :class:`collections.abc.Sequence` which consists of
     one or more :class:`wand.color.Color` values.
 
+    Creating a :class:`~wand.color.Color` for every pixel is slow on large
+    images.  Use :meth:`next_row()` to get each row as a compact array of
+    values instead::
+
+        with iter(image) as iterator:
+            for _ in range(image.height):
+                row = iterator.next_row(channel_map='RGB', storage='char')
+                red, green, blue = row[0]
+
     :param image: the image to get an iterator
     :type image: :class:`Image`
 
     .. versionadded:: 0.1.3
 
+    .. versionchanged:: 0.5.3
+       Added :meth:`next_row()` method.
+
     """
 
     c_is_resource = library.IsPixelIterator
@@ -5411,12 +7205,15 @@ class Iterator(Resource, abc.Iterator):
                     raise TypeError('expected a wand.image.Image instance, '
                                     'not ' + repr(image))
                 self.resource = library.NewPixelIterator(image.wand)
-                self.height = image.height
+                self.image = image
+                self.width, self.height = image.size
             else:
                 if not isinstance(iterator, Iterator):
                     raise TypeError('expected a wand.image.Iterator instance, '
                                     'not ' + repr(iterator))
                 self.resource = library.ClonePixelIterator(iterator.resource)
+                self.image = iterator.image
+                self.width = iterator.width
                 self.height = iterator.height
         self.raise_exception()
         self.cursor = 0
@@ -5455,6 +7252,40 @@ class Iterator(Resource, abc.Iterator):
 
     next = __next__  # Python 2 compatibility
 
+    def next_row(self, channel_map='RGBA', storage='double', out=None):
+        """Gets the next row as a flat array of pixel values, exported by
+        a single :c:func:`MagickExportImagePixels` call rather than creating
+        a :class:`~wand.color.Color` for every pixel.  It advances the
+        iterator like :meth:`next()`.
+
+        :param channel_map: a string listing the channel data format for
+                            each pixel.  See
+                            :meth:`~BaseImage.export_pixels()`.
+        :type channel_map: :class:`basestring`
+        :param storage: what data type each value should be calculated as.
+                        See :const:`STORAGE_TYPES`.
+        :type storage: :class:`basestring`
+        :param out: an optional writable buffer to reuse for every row.
+                    It must be at least ``width * len(channel_map)`` values
+                    large.
+        :returns: ``out``, or a new :mod:`ctypes` array of ``width`` pixels
+                  each of ``len(channel_map)`` values.
+        :raises StopIteration: when there are no more rows.
+
+        .. versionadded:: 0.5.3
+        """
+        if self.cursor >= self.height:
+            self.destroy()
+            raise StopIteration()
+        if out is None:
+            out = _new_pixel_buffer(channel_map, storage, self.width)
+        self.image.export_pixels(0, self.cursor, self.width, 1,
+                                 channel_map=channel_map, storage=storage,
+                                 out=out)
+        # Keep the underlying pixel iterator at the same row.
+        self.seek(self.cursor + 1)
+        return out
+
     def clone(self):
         """Clones the same iterator.
 
@@ -5896,6 +7727,7 @@ class HistogramDict(abc.Mapping):
             ctypes.byref(self.size)
         )
         self.counts = None
+        self._count_array = None
 
     def __del__(self):
         if self.pixels:
@@ -5928,6 +7760,69 @@ class HistogramDict(abc.Mapping):
             color = Color.from_pixelwand(self.pixels[i])
             self.counts[color] = color_count
 
+    def _build_count_array(self):
+        size = self.size.value
+        counts = (ctypes.c_size_t * size)()
+        for i in xrange(size):
+            counts[i] = library.PixelGetColorCount(self.pixels[i])
+        self._count_array = counts
+
+    def arrays(self):
+        """Gets the histogram as two contiguous arrays in the same order,
+        without creating any :class:`~wand.color.Color` object.  Note that
+        they're still filled color by color from the pixel wands of the
+        histogram, i.e. it takes a couple of native calls per color.
+
+        :returns: a pair of ``samples``, an array of
+                  :class:`~wand.cdefs.structures.MagickPixelPacket`
+                  (or :class:`~wand.cdefs.structures.PixelInfo` with
+                  ImageMagick-7) structures, and ``counts``, an array of
+                  :c:type:`size_t`
+        :rtype: :class:`tuple`
+
+        .. versionadded:: 0.5.3
+
+        """
+        if MAGICK_VERSION_NUMBER < 0x700:
+            pixel_structure = MagickPixelPacket
+        else:
+            pixel_structure = PixelInfo
+        size = self.size.value
+        samples = (pixel_structure * size)()
+        counts = (ctypes.c_size_t * size)()
+        for i in xrange(size):
+            counts[i] = library.PixelGetColorCount(self.pixels[i])
+            library.PixelGetMagickColor(self.pixels[i],
+                                        ctypes.byref(samples[i]))
+        self._count_array = counts
+        return samples, counts
+
+    def most_common(self, n=None):
+        """Lists the ``n`` most common colors, from the most common to the
+        least.  Unlike iterating the mapping, only the listed colors are
+        turned into :class:`~wand.color.Color` objects.
+
+        :param n: the number of colors to list.  all colors by default
+        :type n: :class:`numbers.Integral`
+        :returns: ``(color, count)`` pairs
+        :rtype: :class:`list`
+
+        .. versionadded:: 0.5.3
+
+        """
+        if n is not None and not isinstance(n, numbers.Integral):
+            raise TypeError('n must be an integer, not ' + repr(n))
+        if self._count_array is None:
+            self._build_count_array()
+        counts = self._count_array
+        indices = xrange(len(counts))
+        if n is None:
+            indices = sorted(indices, key=counts.__getitem__, reverse=True)
+        else:
+            indices = heapq.nlargest(n, indices, key=counts.__getitem__)
+        return [(Color.from_pixelwand(self.pixels[i]), counts[i])
+                for i in indices]
+
 
 class ClosedImageError(DestroyedResourceError):
     """An error that rises when some code tries access to an already closed
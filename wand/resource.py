@@ -4,9 +4,14 @@
 There is the global resource to manage in MagickWand API. This module
 implements automatic global resource management through reference counting.
 
+The reference counting is thread-safe, so that resources can be created
+and destroyed by many threads at once.  A resource itself, e.g. an
+:class:`~wand.image.Image`, has to be used by one thread at a time though.
+
 """
 import contextlib
 import ctypes
+import threading
 import warnings
 
 from .api import libmagick, library
@@ -15,7 +20,8 @@ from .exceptions import TYPE_MAP, WandException
 from .version import MAGICK_VERSION_NUMBER
 
 __all__ = ('genesis', 'terminus', 'increment_refcount', 'decrement_refcount',
-           'limits', 'Resource', 'ResourceLimits', 'DestroyedResourceError')
+           'keep_alive', 'session', 'limits', 'Resource', 'ResourceLimits',
+           'DestroyedResourceError')
 
 
 def genesis():
@@ -52,31 +58,112 @@ def terminus():
 #:
 reference_count = 0
 
+#: (:class:`threading.RLock`) The lock that guards :data:`reference_count`,
+#: so that the MagickWand API is never cleaned up by a thread while another
+#: thread is instantiating a resource.  It's reentrant, because destructors
+#: of garbage-collected resources can run while it's held.
+#:
+#: .. versionadded:: 0.5.3
+reference_count_lock = threading.RLock()
+
 
 def increment_refcount():
     """Increments the :data:`reference_count` and instantiates the MagickWand
     API if it is the first use.
 
+    .. versionchanged:: 0.5.3
+       It became thread-safe.
+
     """
     global reference_count
-    if reference_count:
-        reference_count += 1
-    else:
-        genesis()
-        reference_count = 1
+    with reference_count_lock:
+        if reference_count:
+            reference_count += 1
+        else:
+            genesis()
+            reference_count = 1
 
 
 def decrement_refcount():
     """Decrements the :data:`reference_count` and cleans up the MagickWand
     API if it will be no more used.
 
+    .. versionchanged:: 0.5.3
+       It became thread-safe.
+
     """
     global reference_count
-    if not reference_count:
-        raise RuntimeError('wand.resource.reference_count is already zero')
-    reference_count -= 1
-    if not reference_count:
-        terminus()
+    with reference_count_lock:
+        if not reference_count:
+            raise RuntimeError('wand.resource.reference_count is already '
+                               'zero')
+        reference_count -= 1
+        if not reference_count:
+            terminus()
+
+
+# Whether keep_alive() holds a reference.
+_kept_alive = False
+
+
+def keep_alive(enabled=True):
+    """Keeps the MagickWand API instantiated for the life of the process,
+    even while no resource is in use.  Otherwise the API is cleaned up
+    whenever the last resource is destroyed, and instantiated again by
+    the next one, which reloads ImageMagick's configuration & policies
+    every time e.g. a server opens one image per request::
+
+        from wand.resource import keep_alive
+
+        keep_alive()
+
+    It's idempotent.  The API isn't cleaned up at exit, as with resources
+    that are never destroyed.
+
+    :param enabled: :const:`False` to stop keeping the API alive
+    :type enabled: :class:`bool`
+
+    .. seealso::
+
+       :func:`session()`
+          Keeps the API alive only within a :keyword:`with` block.
+
+    .. versionadded:: 0.5.3
+
+    """
+    global _kept_alive
+    with reference_count_lock:
+        if enabled and not _kept_alive:
+            increment_refcount()
+            _kept_alive = True
+        elif not enabled and _kept_alive:
+            _kept_alive = False
+            decrement_refcount()
+
+
+@contextlib.contextmanager
+def session():
+    """Keeps the MagickWand API instantiated within a :keyword:`with`
+    block, even while no resource is in use::
+
+        from wand.resource import session
+
+        with session():
+            for blob in blobs:
+                with Image(blob=blob) as img:
+                    ...
+
+    Sessions can be nested, and can be used together with
+    :func:`keep_alive()`.
+
+    .. versionadded:: 0.5.3
+
+    """
+    increment_refcount()
+    try:
+        yield
+    finally:
+        decrement_refcount()
 
 
 class Resource(object):
@@ -0,0 +1,307 @@
+""":mod:`wand.similarity` --- Perceptual hashes
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+.. versionadded:: 0.5.3
+
+Perceptual hashes summarize what an image looks like in a single integer,
+so that near-duplicate images have hashes only a few bits apart, even if
+they were resized, recompressed or slightly retouched.  Comparing two
+hashes is much cheaper than comparing two images with
+:meth:`~wand.image.BaseImage.compare()`::
+
+    from wand.image import Image
+    from wand.similarity import BKTree, perceptual_hash
+
+    index = BKTree()
+    for filename in filenames:
+        with Image(filename=filename) as img:
+            index.add(perceptual_hash(img), filename)
+
+    with Image(filename='query.jpg') as img:
+        for distance, hash_, filename in index.search(perceptual_hash(img),
+                                                      max_distance=6):
+            print(filename, distance)
+
+Every hash function downscales a copy of the image, and exports it as
+grayscale intensities with a single
+:meth:`~wand.image.BaseImage.export_pixels()` call.
+
+"""
+import ctypes
+import math
+import numbers
+
+from .api import library
+from .compat import xrange
+from .image import BaseImage
+
+__all__ = ('HASH_FUNCTIONS', 'BKTree', 'average_hash', 'difference_hash',
+           'hamming_distance', 'perceptual_hash')
+
+
+def _gray_pixels(image, width, height, storage='char'):
+    """Downscales a copy of the ``image`` to ``width`` x ``height``,
+    ignoring its aspect ratio, and exports its intensities row by row.
+
+    :param image: the image to downscale
+    :type image: :class:`~wand.image.BaseImage`
+    :param width: the width to downscale to
+    :type width: :class:`numbers.Integral`
+    :param height: the height to downscale to
+    :type height: :class:`numbers.Integral`
+    :param storage: ``'char'`` or ``'double'``
+    :type storage: :class:`basestring`
+    :returns: ``width * height`` intensities
+    :rtype: :class:`ctypes.Array`
+
+    """
+    if not isinstance(image, BaseImage):
+        raise TypeError('image must be a wand.image.BaseImage instance, '
+                        'not ' + repr(image))
+    c_type = ctypes.c_ubyte if storage == 'char' else ctypes.c_double
+    pixels = (c_type * (width * height))()
+    with image.clone() as small:
+        small.thumbnail('{0}x{1}!'.format(width, height))
+        # thumbnail() leaves the iterator at the last frame of animations.
+        library.MagickResetIterator(small.wand)
+        small.export_pixels(channel_map='I', storage=storage, out=pixels)
+    return pixels
+
+
+def _check_hash_size(hash_size):
+    if not isinstance(hash_size, numbers.Integral):
+        raise TypeError('hash_size must be an integer, not ' +
+                        repr(hash_size))
+    elif hash_size < 2:
+        raise ValueError('hash_size must be at least 2, not ' +
+                         repr(hash_size))
+
+
+def _bits_to_int(bits):
+    value = 0
+    for bit in bits:
+        value = (value << 1) | bool(bit)
+    return value
+
+
+def average_hash(image, hash_size=8):
+    """Computes the average hash (aHash) of the ``image``.  Each bit tells
+    whether a pixel of the image downscaled to ``hash_size`` x
+    ``hash_size`` is brighter than the mean.  It's the fastest, but the
+    least robust against gamma & color changes.
+
+    :param image: the image to hash
+    :type image: :class:`~wand.image.BaseImage`
+    :param hash_size: the width & height of the downscaled image.
+                      the hash has ``hash_size ** 2`` bits
+    :type hash_size: :class:`numbers.Integral`
+    :returns: the hash
+    :rtype: :class:`numbers.Integral`
+
+    """
+    _check_hash_size(hash_size)
+    pixels = _gray_pixels(image, hash_size, hash_size)
+    mean = sum(pixels) / float(len(pixels))
+    return _bits_to_int(p > mean for p in pixels)
+
+
+def difference_hash(image, hash_size=8):
+    """Computes the difference hash (dHash) of the ``image``.  Each bit
+    tells whether a pixel of the image downscaled to ``hash_size + 1`` x
+    ``hash_size`` is brighter than its right neighbor, i.e. it follows
+    the gradients of the image.
+
+    :param image: the image to hash
+    :type image: :class:`~wand.image.BaseImage`
+    :param hash_size: the height of the downscaled image.
+                      the hash has ``hash_size ** 2`` bits
+    :type hash_size: :class:`numbers.Integral`
+    :returns: the hash
+    :rtype: :class:`numbers.Integral`
+
+    """
+    _check_hash_size(hash_size)
+    width = hash_size + 1
+    pixels = _gray_pixels(image, width, hash_size)
+    return _bits_to_int(
+        pixels[row + x] > pixels[row + x + 1]
+        for row in xrange(0, len(pixels), width)
+        for x in xrange(hash_size)
+    )
+
+
+def _dct_matrix(size, coefficients):
+    """Builds the rows of the DCT-II basis for the lowest ``coefficients``
+    frequencies of ``size`` samples.
+    """
+    return [[math.cos(math.pi * k * (2 * n + 1) / (2.0 * size))
+             for n in xrange(size)]
+            for k in xrange(coefficients)]
+
+
+def perceptual_hash(image, hash_size=8, highfreq_factor=4):
+    """Computes the perceptual hash (pHash) of the ``image``.  The image
+    is downscaled to ``hash_size * highfreq_factor`` pixels square, and
+    each bit tells whether one of the ``hash_size`` x ``hash_size`` lowest
+    frequencies of its discrete cosine transform is above the median.
+    It's the slowest, but the most robust against retouching.
+
+    :param image: the image to hash
+    :type image: :class:`~wand.image.BaseImage`
+    :param hash_size: the number of frequencies in each direction.
+                      the hash has ``hash_size ** 2`` bits
+    :type hash_size: :class:`numbers.Integral`
+    :param highfreq_factor: how many times larger than ``hash_size`` the
+                            downscaled image is
+    :type highfreq_factor: :class:`numbers.Integral`
+    :returns: the hash
+    :rtype: :class:`numbers.Integral`
+
+    """
+    _check_hash_size(hash_size)
+    if not isinstance(highfreq_factor, numbers.Integral):
+        raise TypeError('highfreq_factor must be an integer, not ' +
+                        repr(highfreq_factor))
+    elif highfreq_factor < 1:
+        raise ValueError('highfreq_factor must be a natural number, not ' +
+                         repr(highfreq_factor))
+    size = hash_size * highfreq_factor
+    pixels = _gray_pixels(image, size, size, storage='double')
+    basis = _dct_matrix(size, hash_size)
+    # Only the lowest frequencies are needed, so transform rows, and then
+    # columns, against the first hash_size basis vectors.
+    rows = [[sum(b * p for b, p in zip(vector, pixels[y:y + size]))
+             for vector in basis]
+            for y in xrange(0, size * size, size)]
+    dct = [sum(vector[y] * rows[y][u] for y in xrange(size))
+           for vector in basis
+           for u in xrange(hash_size)]
+    # The DC term is the mean brightness, which is left out of the median.
+    median = sorted(dct[1:])[(len(dct) - 1) // 2]
+    return _bits_to_int(c > median for c in dct)
+
+
+#: (:class:`dict`) The perceptual hash functions by their common names.
+HASH_FUNCTIONS = {
+    'ahash': average_hash,
+    'dhash': difference_hash,
+    'phash': perceptual_hash
+}
+
+
+def hamming_distance(a, b):
+    """Counts the bits that differ between two hashes.
+
+    :param a: a hash
+    :type a: :class:`numbers.Integral`
+    :param b: another hash
+    :type b: :class:`numbers.Integral`
+    :returns: the number of different bits
+    :rtype: :class:`numbers.Integral`
+
+    """
+    return bin(a ^ b).count('1')
+
+
+class BKTree(object):
+    """Burkhard-Keller tree to find hashes within a Hamming distance of
+    a query without comparing it to every indexed hash.  Each lookup
+    visits only the subtrees that can contain matches, which makes
+    near-duplicate search over millions of hashes practical::
+
+        index = BKTree()
+        index.add(0b1011, 'a.jpg')
+        index.add(0b1001, 'b.jpg')
+        assert index.search(0b1011, max_distance=1) == [
+            (0, 0b1011, 'a.jpg'),
+            (1, 0b1001, 'b.jpg')
+        ]
+
+    :param items: optional ``(hash, value)`` pairs to add
+    :type items: :class:`collections.abc.Iterable`
+    :param distance: the metric between two hashes.
+                     default is :func:`hamming_distance()`
+    :type distance: :class:`collections.abc.Callable`
+
+    """
+
+    def __init__(self, items=(), distance=hamming_distance):
+        if not callable(distance):
+            raise TypeError('distance must be callable, not ' +
+                            repr(distance))
+        self.distance = distance
+        #: The root node.  Each node is a ``[hash, value, children]`` list,
+        #: where ``children`` maps distances to child nodes.
+        self.root = None
+        self.length = 0
+        for hash_, value in items:
+            self.add(hash_, value)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """Iterates every ``(hash, value)`` pair, in no particular order."""
+        if self.root is None:
+            return
+        stack = [self.root]
+        while stack:
+            hash_, value, children = stack.pop()
+            yield hash_, value
+            stack.extend(children.values())
+
+    def add(self, hash_, value=None):
+        """Adds a hash to the index.  The same hash can be added more
+        than once, e.g. with different ``value``\\ s.
+
+        :param hash_: the hash to add
+        :type hash_: :class:`numbers.Integral`
+        :param value: an optional value to associate with the hash,
+                      e.g. the filename of the image
+        """
+        node = [hash_, value, {}]
+        self.length += 1
+        if self.root is None:
+            self.root = node
+            return
+        parent = self.root
+        while True:
+            d = self.distance(hash_, parent[0])
+            child = parent[2].get(d)
+            if child is None:
+                parent[2][d] = node
+                return
+            parent = child
+
+    def search(self, hash_, max_distance):
+        """Finds every hash within ``max_distance`` of ``hash_``.
+
+        :param hash_: the hash to look up
+        :type hash_: :class:`numbers.Integral`
+        :param max_distance: the maximum distance of matches, inclusive
+        :type max_distance: :class:`numbers.Integral`
+        :returns: ``(distance, hash, value)`` triples, nearest first
+        :rtype: :class:`list`
+
+        """
+        if not isinstance(max_distance, numbers.Integral):
+            raise TypeError('max_distance must be an integer, not ' +
+                            repr(max_distance))
+        elif max_distance < 0:
+            raise ValueError('max_distance cannot be less than zero')
+        found = []
+        if self.root is None:
+            return found
+        stack = [self.root]
+        while stack:
+            node_hash, value, children = stack.pop()
+            d = self.distance(hash_, node_hash)
+            if d <= max_distance:
+                found.append((d, node_hash, value))
+            # By the triangle inequality, matches can only be in children
+            # whose distance to this node is within max_distance of d.
+            for child_distance, child in children.items():
+                if d - max_distance <= child_distance <= d + max_distance:
+                    stack.append(child)
+        found.sort(key=lambda match: (match[0], match[1]))
+        return found